@@ -6,6 +6,7 @@ from nimbletools_control_plane.auth.base import (
     extract_token,
     get_current_user,
     get_workspace_namespace,
+    get_workspace_namespace_object,
     require_permission,
 )
 from nimbletools_control_plane.auth.models import UserContext
@@ -15,5 +16,6 @@ __all__ = [
     "extract_token",
     "get_current_user",
     "get_workspace_namespace",
+    "get_workspace_namespace_object",
     "require_permission",
 ]
@@ -5,6 +5,7 @@ This module provides FastAPI dependencies for authentication using
 the configured provider.
 """
 
+import asyncio
 import logging
 from typing import Annotated, Any
 
@@ -13,6 +14,7 @@ from kubernetes import client
 from kubernetes.client.rest import ApiException
 
 from nimbletools_control_plane import provider
+from nimbletools_control_plane.k8s_clients import get_api_client
 
 logger = logging.getLogger(__name__)
 
@@ -40,24 +42,23 @@ async def get_current_user(request: Request) -> dict[str, Any]:
     return user
 
 
-async def get_workspace_namespace(
+async def get_workspace_namespace_object(
     workspace_id: str,
     user: Annotated[dict[str, Any], Depends(get_current_user)],
-) -> str:
+) -> client.V1Namespace:
     """
-    Validate user can access a workspace and return namespace name.
+    Validate user can access a workspace and return its namespace object.
 
-    This is a dependency that:
-    1. Gets the current user
-    2. Checks workspace access via provider
-    3. Returns the namespace name
+    The namespace comes from the same label-selector lookup used to resolve
+    the workspace, so handlers that need its labels or annotations can depend
+    on this instead of issuing a second read_namespace call.
 
     Args:
         workspace_id: Workspace ID from path
         user: Current authenticated user
 
     Returns:
-        Namespace name for the workspace
+        Namespace object for the workspace
 
     Raises:
         HTTPException: If access denied or workspace not found
@@ -71,17 +72,19 @@ async def get_workspace_namespace(
         )
         raise HTTPException(status_code=403, detail="Access denied to workspace")
 
-    # Resolve workspace_id to namespace name
+    # Resolve workspace_id to namespace
     try:
-        k8s_core = client.CoreV1Api()
-        namespaces = k8s_core.list_namespace(
-            label_selector=f"mcp.nimbletools.dev/workspace_id={workspace_id}"
+        k8s_core = client.CoreV1Api(get_api_client())
+        namespaces = await asyncio.to_thread(
+            k8s_core.list_namespace,
+            label_selector=f"mcp.nimbletools.dev/workspace_id={workspace_id}",
         )
 
         if not namespaces.items:
             raise HTTPException(status_code=404, detail=f"Workspace {workspace_id} not found")
 
-        return str(namespaces.items[0].metadata.name)
+        namespace: client.V1Namespace = namespaces.items[0]
+        return namespace
 
     except ApiException as e:
         if e.status == 404:
@@ -92,6 +95,32 @@ async def get_workspace_namespace(
         raise HTTPException(status_code=500, detail="Error validating workspace access") from e
 
 
+async def get_workspace_namespace(
+    workspace_id: str,
+    user: Annotated[dict[str, Any], Depends(get_current_user)],
+) -> str:
+    """
+    Validate user can access a workspace and return namespace name.
+
+    This is a dependency that:
+    1. Gets the current user
+    2. Checks workspace access via provider
+    3. Returns the namespace name
+
+    Args:
+        workspace_id: Workspace ID from path
+        user: Current authenticated user
+
+    Returns:
+        Namespace name for the workspace
+
+    Raises:
+        HTTPException: If access denied or workspace not found
+    """
+    namespace = await get_workspace_namespace_object(workspace_id, user)
+    return str(namespace.metadata.name)
+
+
 async def require_permission(
     resource: str, action: str, user: Annotated[dict[str, Any], Depends(get_current_user)]
 ) -> dict[str, Any]:
@@ -0,0 +1,38 @@
+"""Shared Kubernetes API client for the control plane.
+
+Constructing ``client.CoreV1Api()`` and friends without an argument builds a
+fresh ``ApiClient`` each time, and with it a fresh urllib3 pool, so keep-alive
+connections to the API server are never reused. Route handlers pass the shared
+client from this module instead, e.g. ``client.CoreV1Api(get_api_client())``.
+The typed API wrappers themselves are cheap and are still built per call.
+"""
+
+import logging
+import os
+
+from kubernetes import client
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on pooled connections to the API server. Blocking calls run in
+# worker threads, so raise this with the number of concurrent requests.
+CONNECTION_POOL_MAXSIZE = int(os.getenv("K8S_CONNECTION_POOL_MAXSIZE", "50"))
+
+# Global API client instance, built on first use so the kube config loaded at
+# startup is picked up
+_api_client: client.ApiClient | None = None
+
+
+def get_api_client() -> client.ApiClient:
+    """Get the shared Kubernetes API client."""
+    global _api_client  # noqa: PLW0603
+
+    if _api_client is None:
+        configuration = client.Configuration.get_default_copy()
+        configuration.connection_pool_maxsize = CONNECTION_POOL_MAXSIZE
+        _api_client = client.ApiClient(configuration)
+        logger.debug(
+            "Created shared Kubernetes API client (pool maxsize %d)", CONNECTION_POOL_MAXSIZE
+        )
+
+    return _api_client
@@ -249,6 +249,14 @@ class WorkspaceSecretSetRequest(BaseModel):
     secret_value: str = Field(..., description="Secret value to store")
 
 
+class WorkspaceSecretsSetRequest(BaseModel):
+    """Workspace secrets batch set request"""
+
+    secrets: dict[str, str] = Field(
+        ..., min_length=1, description="Secret values to store, keyed by secret key"
+    )
+
+
 class WorkspaceSecretResponse(BaseModel):
     """Workspace secret operation response"""
 
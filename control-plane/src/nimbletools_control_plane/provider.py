@@ -23,6 +23,9 @@ import yaml
 
 logger = logging.getLogger(__name__)
 
+# Prefer libyaml's C loader when PyYAML was built with it
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 class ProviderProtocol(Protocol):
     """Protocol defining the provider interface."""
@@ -71,7 +74,7 @@ def load_provider_config() -> dict[str, Any]:
 
     logger.info("Loading provider config from: %s", config_path)
     with Path(config_path).open() as f:
-        result = yaml.safe_load(f)
+        result = yaml.load(f, Loader=_YamlLoader)
         return cast("dict[str, Any]", result)
 
 
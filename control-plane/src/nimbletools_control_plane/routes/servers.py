@@ -2,9 +2,15 @@
 Server Router for NimbleTools Control Plane
 """
 
+import asyncio
+import copy
+import heapq
+import itertools
 import json
 import logging
+import operator
 import re
+import time
 from datetime import UTC, datetime
 from typing import Any
 from uuid import UUID as UUID_cls
@@ -12,16 +18,20 @@ from uuid import UUID as UUID_cls
 from fastapi import APIRouter, Depends, HTTPException, Request
 from kubernetes import client
 from kubernetes.client.rest import ApiException
+from pydantic import TypeAdapter
 
 from nimbletools_control_plane.auth import get_workspace_namespace
 from nimbletools_control_plane.exceptions import (
+    ControlPlaneError,
     KubernetesOperationError,
     convert_to_http_exception,
+    handle_kubernetes_errors,
     handle_optional_kubernetes_resource,
     log_operation_start,
     log_operation_success,
 )
-from nimbletools_control_plane.mcp_server_models import MCPServer
+from nimbletools_control_plane.k8s_clients import get_api_client
+from nimbletools_control_plane.mcp_server_models import MCPServer, Package
 from nimbletools_control_plane.models import (
     LogLevel,
     ServerDeleteResponse,
@@ -41,6 +51,24 @@ from nimbletools_control_plane.models import (
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/v1/workspaces", tags=["servers"])
 
+# Field manager recorded on MCPServices applied by the control plane
+_FIELD_MANAGER = "nimbletools-control-plane"
+
+# Pod template annotation that triggers a rolling restart, as used by kubectl
+_RESTART_ANNOTATION = "kubectl.kubernetes.io/restartedAt"
+
+
+def _short_id(server_id: str) -> str:
+    """Strip the namespace from a full server name (ai.nimblebrain/echo -> echo)."""
+    return server_id.rpartition("/")[2]
+
+
+# Node architecture effectively never changes for a running cluster, so a
+# successful detection is reused for this long instead of listing nodes on
+# every deploy.
+_CLUSTER_ARCH_TTL_SECONDS = 300.0
+_cluster_arch_cache: tuple[float, str] | None = None
+
 
 def _get_cluster_architecture() -> str:
     """Get the primary architecture of the cluster nodes.
@@ -48,9 +76,16 @@ def _get_cluster_architecture() -> str:
     Returns 'amd64' or 'arm64' based on node labels.
     Defaults to 'amd64' if unable to determine.
     """
+    global _cluster_arch_cache  # noqa: PLW0603
+
+    now = time.monotonic()
+    if _cluster_arch_cache is not None and _cluster_arch_cache[0] > now:
+        return _cluster_arch_cache[1]
+
     try:
-        k8s_core = client.CoreV1Api()
-        nodes = k8s_core.list_node()
+        k8s_core = client.CoreV1Api(get_api_client())
+        # Only the first node is inspected, so don't fetch the rest
+        nodes = k8s_core.list_node(limit=1)
 
         if not nodes.items:
             logger.warning("No nodes found in cluster, defaulting to amd64")
@@ -61,6 +96,7 @@ def _get_cluster_architecture() -> str:
         labels = first_node.metadata.labels or {}
         arch: str = labels.get("kubernetes.io/arch", "amd64")
         logger.debug("Detected cluster architecture: %s", arch)
+        _cluster_arch_cache = (now + _CLUSTER_ARCH_TTL_SECONDS, arch)
         return arch
     except Exception as e:
         logger.warning("Failed to detect cluster architecture: %s, defaulting to amd64", e)
@@ -85,16 +121,13 @@ def _extract_mcpb_filename(url: str) -> str | None:
         return None
 
     # Extract the path component and get the filename
-    try:
-        # Handle URLs like https://github.com/.../mcp-echo-v1.0.0-linux-amd64.mcpb
-        path = url.split("?")[0]  # Remove query params
-        filename = path.split("/")[-1]
+    # Handle URLs like https://github.com/.../mcp-echo-v1.0.0-linux-amd64.mcpb
+    path = url.partition("?")[0]  # Remove query params
+    filename = path.rpartition("/")[2]
 
-        if filename.endswith(".mcpb"):
-            return filename
-        return None
-    except Exception:
-        return None
+    if filename.endswith(".mcpb"):
+        return filename
+    return None
 
 
 def _validate_mcpb_packages(packages: list[Any], cluster_arch: str) -> None:
@@ -106,13 +139,14 @@ def _validate_mcpb_packages(packages: list[Any], cluster_arch: str) -> None:
     1. Each MCPB package has a valid .mcpb URL
     2. At least one package matches the cluster architecture
     """
-    mcpb_packages = [p for p in packages if p.registryType == "mcpb"]
-
-    if not mcpb_packages:
-        return  # No MCPB packages, nothing to validate
+    arch_suffix = f"linux-{cluster_arch}.mcpb"
+    filenames: list[str] = []
+    has_arch_match = False
 
-    # Validate each MCPB package has a valid URL
-    for package in mcpb_packages:
+    # Single pass: validate each MCPB package URL and look for an arch match
+    for package in packages:
+        if package.registryType != "mcpb":
+            continue
         filename = _extract_mcpb_filename(package.identifier)
         if not filename:
             raise MCPBValidationError(
@@ -120,17 +154,18 @@ def _validate_mcpb_packages(packages: list[Any], cluster_arch: str) -> None:
                 "URL must end with a .mcpb filename.",
                 error_code="INVALID_MCPB_URL",
             )
+        filenames.append(filename)
+        if package.identifier.endswith(arch_suffix):
+            has_arch_match = True
 
-    # Validate architecture match
-    arch_suffix = f"linux-{cluster_arch}.mcpb"
-    matching_packages = [p for p in mcpb_packages if p.identifier.endswith(arch_suffix)]
+    if not filenames:
+        return  # No MCPB packages, nothing to validate
 
-    if not matching_packages:
+    if not has_arch_match:
         available_archs = []
-        for p in mcpb_packages:
-            filename = _extract_mcpb_filename(p.identifier)
+        for filename in filenames:
             # Extract arch from filename like "mcp-echo-v1.0.0-linux-amd64.mcpb"
-            if filename and "-linux-" in filename:
+            if "-linux-" in filename:
                 arch_part = filename.split("-linux-")[-1].replace(".mcpb", "")
                 available_archs.append(arch_part)
 
@@ -262,23 +297,24 @@ def _build_resources_config(runtime: Any) -> dict[str, Any]:
     }
 
 
+# Scaling defaults shared by every MCPService; runtime and user overrides are
+# layered on top of a copy.
+_DEFAULT_SCALING: dict[str, Any] = {
+    "minReplicas": 0,
+    "maxReplicas": 10,
+    "targetConcurrency": 10,
+    "scaleDownDelay": "5m",
+}
+
+
 def _build_scaling_config(runtime: Any, user_scaling: dict[str, Any] | None) -> dict[str, Any]:
     """Build scaling configuration"""
-    default_scaling = {
-        "minReplicas": 0,
-        "maxReplicas": 10,
-        "targetConcurrency": 10,
-        "scaleDownDelay": "5m",
-    }
+    default_scaling = _DEFAULT_SCALING.copy()
 
     if runtime and runtime.scaling:
-        default_scaling.update(
-            {
-                "minReplicas": runtime.scaling.minReplicas,
-                "maxReplicas": runtime.scaling.maxReplicas,
-                "enabled": runtime.scaling.enabled,
-            }
-        )
+        default_scaling["minReplicas"] = runtime.scaling.minReplicas
+        default_scaling["maxReplicas"] = runtime.scaling.maxReplicas
+        default_scaling["enabled"] = runtime.scaling.enabled
 
     if user_scaling:
         default_scaling.update(user_scaling)
@@ -286,6 +322,14 @@ def _build_scaling_config(runtime: Any, user_scaling: dict[str, Any] | None) ->
     return default_scaling
 
 
+# Label keys for the first three registry categories of a server
+_CATEGORY_LABEL_KEYS = (
+    "mcp.nimbletools.dev/category-0",
+    "mcp.nimbletools.dev/category-1",
+    "mcp.nimbletools.dev/category-2",
+)
+
+
 def _build_labels_and_annotations(
     mcp_server: MCPServer, workspace_id: str, runtime: Any
 ) -> tuple[dict[str, str], dict[str, str]]:
@@ -297,10 +341,10 @@ def _build_labels_and_annotations(
         "mcp.nimbletools.dev/server-name": mcp_server.name.replace("/", "-"),
     }
 
-    # Add categories as labels
+    # Add categories as labels; zip stops at the first three
     if runtime and runtime.registry and runtime.registry.categories:
-        for i, category in enumerate(runtime.registry.categories[:3]):
-            labels[f"mcp.nimbletools.dev/category-{i}"] = category
+        for key, category in zip(_CATEGORY_LABEL_KEYS, runtime.registry.categories, strict=False):
+            labels[key] = category
 
     # Build annotations
     annotations = {
@@ -318,7 +362,11 @@ def _build_labels_and_annotations(
     return labels, annotations
 
 
-def _serialize_packages(packages: list[Any] | None) -> list[dict[str, Any]]:
+# Built once so the whole package list is serialized in a single call
+_PACKAGES_ADAPTER = TypeAdapter(list[Package])
+
+
+def _serialize_packages(packages: list[Package] | None) -> list[dict[str, Any]]:
     """Safely serialize packages to dict format"""
     if not packages:
         logger.info("No packages to serialize")
@@ -328,9 +376,9 @@ def _serialize_packages(packages: list[Any] | None) -> list[dict[str, Any]]:
         # Use mode="json" to convert HttpUrl and other Pydantic types to JSON-serializable strings
         # This prevents "'HttpUrl' object has no attribute 'openapi_types'" errors when
         # the Kubernetes client tries to serialize the CRD body
-        serialized = [
-            pkg.model_dump(exclude_none=False, by_alias=False, mode="json") for pkg in packages
-        ]
+        serialized: list[dict[str, Any]] = _PACKAGES_ADAPTER.dump_python(
+            packages, exclude_none=False, by_alias=False, mode="json"
+        )
         logger.info("Serialized %d packages successfully", len(serialized))
         return serialized
     except Exception as e:
@@ -338,6 +386,16 @@ def _serialize_packages(packages: list[Any] | None) -> list[dict[str, Any]]:
         return []
 
 
+# Routing defaults shared by every MCPService; per-server fields (path, port)
+# and runtime overrides are layered on top of a copy.
+_DEFAULT_ROUTING: dict[str, Any] = {
+    "healthPath": "/health",
+    "healthCheck": True,
+    "mcpPath": "/mcp",
+    "discoveryPath": "/mcp/discover",
+}
+
+
 def _create_mcpservice_spec_from_mcp_server(
     mcp_server: MCPServer,
     workspace_id: str,
@@ -349,7 +407,7 @@ def _create_mcpservice_spec_from_mcp_server(
     routing: dict[str, Any] | None = None,
 ) -> dict[str, Any]:
     """Create MCPService specification from MCP server definition"""
-    server_id = mcp_server.name.split("/")[-1]
+    server_id = _short_id(mcp_server.name)
     runtime = mcp_server.nimbletools_runtime
 
     # Extract configurations using helper functions
@@ -359,13 +417,13 @@ def _create_mcpservice_spec_from_mcp_server(
     labels, annotations = _build_labels_and_annotations(mcp_server, workspace_id, runtime)
 
     # Build routing config with health path and MCP endpoint path
-    health_path = "/health"
-    health_check_enabled = True
-    mcp_path = "/mcp"  # Default MCP endpoint path
+    default_routing = _DEFAULT_ROUTING.copy()
+    default_routing["path"] = f"/services/{server_id}"
+    default_routing["port"] = container_config["port"]
 
     if runtime and runtime.container and runtime.container.healthCheck:
-        health_path = runtime.container.healthCheck.path
-        health_check_enabled = runtime.container.healthCheck.enabled
+        default_routing["healthPath"] = runtime.container.healthCheck.path
+        default_routing["healthCheck"] = runtime.container.healthCheck.enabled
 
     # Read MCP endpoint path from deployment config if available
     if (
@@ -374,16 +432,8 @@ def _create_mcpservice_spec_from_mcp_server(
         and runtime.deployment
         and hasattr(runtime.deployment, "mcpPath")
     ):
-        mcp_path = runtime.deployment.mcpPath
-
-    default_routing = {
-        "path": f"/services/{server_id}",
-        "port": container_config["port"],
-        "healthPath": health_path,
-        "healthCheck": health_check_enabled,
-        "mcpPath": mcp_path,
-        "discoveryPath": "/mcp/discover",
-    }
+        default_routing["mcpPath"] = runtime.deployment.mcpPath
+
     if routing:
         default_routing.update(routing)
 
@@ -436,23 +486,70 @@ def _create_mcpservice_spec_from_mcp_server(
 @handle_optional_kubernetes_resource("reading", "deployment", default_value=None)  # type: ignore[misc]
 async def get_deployment_if_exists(name: str, namespace: str) -> Any:
     """Get deployment if it exists, return None if not found"""
-    k8s_apps = client.AppsV1Api()
-    return k8s_apps.read_namespaced_deployment(name=name, namespace=namespace)
+    k8s_apps = client.AppsV1Api(get_api_client())
+    return await asyncio.to_thread(
+        k8s_apps.read_namespaced_deployment, name=name, namespace=namespace
+    )
 
 
 @handle_optional_kubernetes_resource("reading", "service", default_value=None)  # type: ignore[misc]
 async def get_service_if_exists(name: str, namespace: str) -> Any:
     """Get service if it exists, return None if not found"""
-    k8s_core = client.CoreV1Api()
-    return k8s_core.read_namespaced_service(name=name, namespace=namespace)
+    k8s_core = client.CoreV1Api(get_api_client())
+    return await asyncio.to_thread(k8s_core.read_namespaced_service, name=name, namespace=namespace)
+
+
+@handle_kubernetes_errors("listing", "deployments")  # type: ignore[untyped-decorator]
+async def list_deployments_by_name(namespace: str) -> dict[str, Any]:
+    """List the operator-managed MCP server deployments in a namespace, keyed by name"""
+    k8s_apps = client.AppsV1Api(get_api_client())
+    deployments = await asyncio.to_thread(
+        k8s_apps.list_namespaced_deployment,
+        namespace=namespace,
+        label_selector="mcp.nimbletools.dev/service=true",
+    )
+    return {deployment.metadata.name: deployment for deployment in deployments.items}
+
+
+def _optional_resource_or_none(result: Any, resource_type: str, server_id: str) -> Any:
+    """Unwrap a gathered optional-resource fetch, logging and dropping failures."""
+    if isinstance(result, KubernetesOperationError):
+        logger.warning(
+            "Kubernetes error getting %s for server %s: %s",
+            resource_type,
+            server_id,
+            result.message,
+        )
+        return None
+    if isinstance(result, Exception):
+        logger.warning(
+            "Unexpected error getting %s for server %s: %s", resource_type, server_id, result
+        )
+        return None
+    if isinstance(result, BaseException):
+        raise result
+    return result
+
+
+# Container waiting reasons that indicate a failure, not just a pending start
+_POD_FAILURE_REASONS = frozenset(
+    {
+        "ImagePullBackOff",
+        "ErrImagePull",
+        "CrashLoopBackOff",
+        "RunContainerError",
+        "CreateContainerConfigError",
+        "InvalidImageName",
+    }
+)
 
 
 async def _check_pod_failure_status(namespace: str, server_name: str) -> bool:
     """Check if any pods have failure status like ImagePullBackOff"""
     try:
-        k8s_core = client.CoreV1Api()
-        pods = k8s_core.list_namespaced_pod(
-            namespace=namespace, label_selector=f"app={server_name}"
+        k8s_core = client.CoreV1Api(get_api_client())
+        pods = await asyncio.to_thread(
+            k8s_core.list_namespaced_pod, namespace=namespace, label_selector=f"app={server_name}"
         )
 
         for pod in pods.items:
@@ -460,16 +557,7 @@ async def _check_pod_failure_status(namespace: str, server_name: str) -> bool:
                 for container_status in pod.status.container_statuses:
                     if container_status.state and container_status.state.waiting:
                         waiting_reason = container_status.state.waiting.reason
-                        # These reasons indicate failures, not just pending
-                        failure_reasons = [
-                            "ImagePullBackOff",
-                            "ErrImagePull",
-                            "CrashLoopBackOff",
-                            "RunContainerError",
-                            "CreateContainerConfigError",
-                            "InvalidImageName",
-                        ]
-                        if waiting_reason in failure_reasons:
+                        if waiting_reason in _POD_FAILURE_REASONS:
                             return True
     except Exception as e:
         logger.warning("Failed to check pod status for server %s: %s", server_name, e)
@@ -518,18 +606,19 @@ async def determine_deployment_phase(deployment: Any, namespace: str, server_nam
 
 @router.get("/{workspace_id}/servers")
 async def list_workspace_servers(
-    workspace_id: str,
+    workspace_id: UUID_cls,
     request: Request,
     namespace_name: str = Depends(get_workspace_namespace),
 ) -> ServerListResponse:
     """List servers deployed in a workspace"""
 
     try:
-        log_operation_start("listing servers", "workspace", workspace_id)
-        k8s_custom = client.CustomObjectsApi()
+        log_operation_start("listing servers", "workspace", str(workspace_id))
+        k8s_custom = client.CustomObjectsApi(get_api_client())
 
         # List MCPServices in the workspace namespace
-        mcpservices = k8s_custom.list_namespaced_custom_object(
+        mcpservices = await asyncio.to_thread(
+            k8s_custom.list_namespaced_custom_object,
             group="mcp.nimbletools.dev",
             version="v1",
             namespace=namespace_name,
@@ -537,55 +626,86 @@ async def list_workspace_servers(
         )
 
         servers = []
+        items = []
+        for item in mcpservices.get("items", []):
+            if not item.get("metadata", {}).get("name"):
+                # ServerSummary is built without validation below, so a nameless
+                # object would otherwise slip into the response as id=None
+                logger.warning("Skipping MCPService without a name in %s", namespace_name)
+                continue
+            items.append(item)
+
+        # Fetch every server deployment in one call instead of one GET per server.
+        # If the list fails, each server below reports Unknown.
+        deployments_by_name: dict[str, Any] | None = None
+        if items:
+            try:
+                deployments_by_name = await list_deployments_by_name(namespace_name)
+            except ControlPlaneError as e:
+                logger.warning(
+                    "Error listing deployments in namespace %s: %s",
+                    namespace_name,
+                    e.message,
+                )
 
-        for mcpservice in mcpservices.get("items", []):
-            server_name = mcpservice.get("metadata", {}).get("name")
+        # Resolve every server's phase concurrently; servers with unavailable
+        # replicas need a pod lookup of their own.
+        server_names = [item["metadata"]["name"] for item in items]
+        phases: list[str | BaseException]
+        if deployments_by_name is not None:
+            phases = await asyncio.gather(
+                *(
+                    determine_deployment_phase(
+                        deployments_by_name.get(f"{server_name}-deployment"),
+                        namespace_name,
+                        server_name,
+                    )
+                    for server_name in server_names
+                ),
+                return_exceptions=True,
+            )
+        else:
+            phases = ["Unknown"] * len(items)
+
+        for mcpservice, server_name, phase in zip(items, server_names, phases, strict=True):
+            metadata = mcpservice.get("metadata", {})
             spec = mcpservice.get("spec", {})
 
             # Get actual deployment status by checking deployment conditions and pod status
             deployment_status = "Unknown"
-            try:
-                deployment = await get_deployment_if_exists(
-                    f"{server_name}-deployment", namespace_name
-                )
-                deployment_status = await determine_deployment_phase(
-                    deployment, namespace_name, server_name
-                )
-            except KubernetesOperationError as e:
-                # Handle transient Kubernetes API errors gracefully
-                logger.warning(
-                    "Kubernetes error getting deployment status for server %s: %s",
-                    server_name,
-                    e.message,
-                )
-                deployment_status = "Unknown"
-            except Exception as e:
+            if isinstance(phase, BaseException):
                 # Log unexpected errors but don't fail the entire list operation
                 logger.warning(
-                    "Unexpected error getting deployment status for server %s: %s", server_name, e
+                    "Unexpected error getting deployment status for server %s: %s",
+                    server_name,
+                    phase,
                 )
-                deployment_status = "Unknown"
+            else:
+                deployment_status = phase
 
+            # Fields come straight from our own MCPService spec and nameless
+            # objects were dropped above, so skip per-item validation.
+            # ServerListResponse does not re-validate these entries.
             servers.append(
-                ServerSummary(
+                ServerSummary.model_construct(
                     id=server_name,
                     name=server_name,
-                    workspace_id=UUID_cls(workspace_id),
+                    workspace_id=workspace_id,
                     namespace=namespace_name,
                     image=spec.get("container", {}).get("image", ""),
                     status=deployment_status,
                     replicas=spec.get("replicas", 0),
-                    created=mcpservice.get("metadata", {}).get("creationTimestamp"),
+                    created=metadata.get("creationTimestamp"),
                 )
             )
 
         result = ServerListResponse(
             servers=servers,
-            workspace_id=UUID_cls(workspace_id),
+            workspace_id=workspace_id,
             namespace=namespace_name,
             total=len(servers),
         )
-        log_operation_success("listing servers", "workspace", workspace_id)
+        log_operation_success("listing servers", "workspace", str(workspace_id))
         return result
 
     except Exception as e:
@@ -593,39 +713,86 @@ async def list_workspace_servers(
         raise convert_to_http_exception(e, default_status_code=500)
 
 
+async def _migrate_legacy_mcpservice(
+    k8s_custom: client.CustomObjectsApi,
+    namespace_name: str,
+    server_id: str,
+    mcpservice: dict[str, Any],
+) -> None:
+    """Hand an MCPService written by older releases over to server-side apply.
+
+    Releases before server-side apply replaced the whole object, so its fields
+    are owned by an ``Update`` manager. Applying on top of that would only merge:
+    a field dropped from the spec (an environment variable, say) would stay
+    behind. Such objects are replaced once with the desired spec and their
+    managed fields cleared, so the apply that follows owns every field it sets
+    and later deploys remove whatever they leave out.
+    """
+    try:
+        existing = await asyncio.to_thread(
+            k8s_custom.get_namespaced_custom_object,
+            group="mcp.nimbletools.dev",
+            version="v1",
+            namespace=namespace_name,
+            plural="mcpservices",
+            name=server_id,
+        )
+    except ApiException as e:
+        if e.status == 404:
+            # Nothing to migrate; the apply creates the object
+            return
+        raise
+
+    managed_fields = existing.get("metadata", {}).get("managedFields") or []
+    if any(
+        entry.get("manager") == _FIELD_MANAGER and entry.get("operation") == "Apply"
+        for entry in managed_fields
+    ):
+        return
+
+    logger.info("Migrating MCPService %s to server-side apply", server_id)
+    body = copy.deepcopy(mcpservice)
+    # A single empty entry strips managedFields entirely; an empty list would
+    # leave them untouched
+    body["metadata"]["managedFields"] = [{}]
+    await asyncio.to_thread(
+        k8s_custom.replace_namespaced_custom_object,
+        group="mcp.nimbletools.dev",
+        version="v1",
+        namespace=namespace_name,
+        plural="mcpservices",
+        name=server_id,
+        body=body,
+    )
+
+
 @router.post("/{workspace_id}/servers")
 async def deploy_server_to_workspace(
-    workspace_id: str,
+    workspace_id: UUID_cls,
     server_request: dict[str, Any],
     request: Request,
     namespace_name: str = Depends(get_workspace_namespace),
 ) -> ServerDeployResponse:
     """Deploy server to workspace - accepts MCP server definition from registry"""
 
-    # Log full request payload for debugging
-    logger.info(
-        "POST /%s/servers - incoming payload:\n%s",
-        workspace_id,
-        json.dumps(server_request, indent=2, default=str),
-    )
+    # Log full request payload for debugging. json.dumps runs eagerly, so only
+    # pay for it when debug logging is actually enabled.
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "POST /%s/servers - incoming payload:\n%s",
+            workspace_id,
+            json.dumps(server_request, indent=2, default=str),
+        )
 
     try:
         # The CLI sends the server definition in a "server" field
         mcp_server_data = server_request.get("server", server_request)
 
         # Create MCP server model
-        logger.info(
-            "Creating MCPServer from data: packages=%s",
-            mcp_server_data.get("packages", "NOT_FOUND"),
-        )
-        mcp_server = MCPServer(**mcp_server_data)
-        logger.info(
-            "MCPServer created: packages=%s",
-            len(mcp_server.packages) if mcp_server.packages else "None",
-        )
+        mcp_server = MCPServer.model_validate(mcp_server_data)
 
         # Extract server ID from name
-        server_id = mcp_server.name.split("/")[-1]
+        server_id = _short_id(mcp_server.name)
 
         log_operation_start("deploying server", "server", server_id)
         logger.info(
@@ -644,7 +811,7 @@ async def deploy_server_to_workspace(
 
         # Validate MCPB packages if present
         if mcp_server.packages:
-            cluster_arch = _get_cluster_architecture()
+            cluster_arch = await asyncio.to_thread(_get_cluster_architecture)
             try:
                 _validate_mcpb_packages(mcp_server.packages, cluster_arch)
             except MCPBValidationError as e:
@@ -671,9 +838,12 @@ async def deploy_server_to_workspace(
         routing = server_request.get("routing", {})
 
         # Create MCPService spec from MCP server definition
-        mcpservice = _create_mcpservice_spec_from_mcp_server(
+        # Building the spec may detect the cluster architecture for MCPB
+        # packages, which lists nodes, so keep it off the event loop too
+        mcpservice = await asyncio.to_thread(
+            _create_mcpservice_spec_from_mcp_server,
             mcp_server,
-            workspace_id,
+            str(workspace_id),
             namespace_name,
             replicas,
             environment,
@@ -681,54 +851,34 @@ async def deploy_server_to_workspace(
             scaling,
             routing,
         )
-        logger.info(
-            "Created MCPService spec with packages: %s", "packages" in mcpservice.get("spec", {})
-        )
-        if "packages" in mcpservice.get("spec", {}):
-            logger.info("MCPService packages field: %s", len(mcpservice["spec"]["packages"]))
 
         # Create MCPService in workspace
-        k8s_custom = client.CustomObjectsApi()
-
-        # Check if MCPService already exists
-        try:
-            k8s_custom.get_namespaced_custom_object(
-                group="mcp.nimbletools.dev",
-                version="v1",
-                namespace=namespace_name,
-                plural="mcpservices",
-                name=server_id,
-            )
-            # If it exists, update it instead
-            logger.info("MCPService %s already exists, updating...", server_id)
-            k8s_custom.replace_namespaced_custom_object(
-                group="mcp.nimbletools.dev",
-                version="v1",
-                namespace=namespace_name,
-                plural="mcpservices",
-                name=server_id,
-                body=mcpservice,
-            )
-            message = f"Server {server_id} updated successfully"
-        except ApiException as e:
-            if e.status == 404:
-                # Create new MCPService
-                k8s_custom.create_namespaced_custom_object(
-                    group="mcp.nimbletools.dev",
-                    version="v1",
-                    namespace=namespace_name,
-                    plural="mcpservices",
-                    body=mcpservice,
-                )
-                message = f"Server {server_id} deployed successfully"
-            else:
-                raise
+        k8s_custom = client.CustomObjectsApi(get_api_client())
+
+        # Create or update the MCPService with server-side apply. The Kubernetes
+        # client is blocking, so run each call in a worker thread to keep the
+        # event loop free; the handler still awaits the outcome so API errors
+        # reach the caller.
+        await _migrate_legacy_mcpservice(k8s_custom, namespace_name, server_id, mcpservice)
+        await asyncio.to_thread(
+            k8s_custom.patch_namespaced_custom_object,
+            group="mcp.nimbletools.dev",
+            version="v1",
+            namespace=namespace_name,
+            plural="mcpservices",
+            name=server_id,
+            body=mcpservice,
+            field_manager=_FIELD_MANAGER,
+            force=True,
+            _content_type="application/apply-patch+yaml",
+        )
+        message = f"Server {server_id} deployed successfully"
 
         log_operation_success("deploying server", "server", server_id)
 
         return ServerDeployResponse(
             server_id=server_id,
-            workspace_id=UUID_cls(workspace_id),
+            workspace_id=workspace_id,
             namespace=namespace_name,
             status="pending",
             message=f"{message}. Deployment is being processed by the operator.",
@@ -745,29 +895,50 @@ async def deploy_server_to_workspace(
         ) from e
 
 
+# Upper-cased level names as they appear in log lines, including common aliases
+_LEVEL_MAP: dict[str, LogLevel] = {
+    "DEBUG": LogLevel.DEBUG,
+    "INFO": LogLevel.INFO,
+    "WARNING": LogLevel.WARNING,
+    "WARN": LogLevel.WARNING,
+    "ERROR": LogLevel.ERROR,
+    "CRITICAL": LogLevel.CRITICAL,
+    "FATAL": LogLevel.CRITICAL,
+}
+
+# Severity rank of each level, used for minimum-level filtering
+_LEVEL_ORDER: dict[LogLevel, int] = {
+    LogLevel.DEBUG: 0,
+    LogLevel.INFO: 1,
+    LogLevel.WARNING: 2,
+    LogLevel.ERROR: 3,
+    LogLevel.CRITICAL: 4,
+}
+
+
 def _parse_log_level(level_str: str) -> LogLevel:
     """Parse log level string to LogLevel enum."""
-    level_str = level_str.upper()
-    if level_str == "WARN":
-        return LogLevel.WARNING
-    elif level_str == "FATAL":
-        return LogLevel.CRITICAL
-    elif level_str in ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]:
-        return LogLevel[level_str]
-    return LogLevel.INFO
+    return _LEVEL_MAP.get(level_str.upper(), LogLevel.INFO)
+
+
+# Log line formats recognised by _parse_log_line, compiled once
+_K8S_LOG_RE = re.compile(r"^(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(?:\.\d+)?Z)\s*(\w+):?\s+(.*)$")
+_ISO_LOG_RE = re.compile(
+    r"^(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(?:\.\d+)?Z?)\s*\[?(\w+)\]?\s+(.*)$"
+)
+_BRACKET_LEVEL_RE = re.compile(r"\[(\w+)\]")
 
 
 def _parse_log_line(log_line: str) -> tuple[datetime | None, LogLevel, str]:
     """Parse a log line to extract timestamp, level, and message"""
     # Try to match Kubernetes timestamp format (with no space before log content)
     # Example: 2025-09-29T05:46:08.722799261Z INFO:     10.42.1.1:42920 - "GET /health HTTP/1.1" 200 OK
-    k8s_pattern = r"^(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(?:\.\d+)?Z)\s*(\w+):?\s+(.*)$"
-    match = re.match(k8s_pattern, log_line)
+    match = _K8S_LOG_RE.match(log_line)
 
     if match:
         timestamp_str, level_str, message = match.groups()
         try:
-            timestamp = datetime.fromisoformat(timestamp_str.replace("Z", "+00:00"))
+            timestamp = datetime.fromisoformat(timestamp_str)
             # Ensure timezone-aware for consistent comparison
             if timestamp.tzinfo is None:
                 timestamp = timestamp.replace(tzinfo=UTC)
@@ -777,13 +948,12 @@ def _parse_log_line(log_line: str) -> tuple[datetime | None, LogLevel, str]:
             pass
 
     # Try to match ISO/RFC3339 format with log level in brackets
-    iso_pattern = r"^(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(?:\.\d+)?Z?)\s*\[?(\w+)\]?\s+(.*)$"
-    match = re.match(iso_pattern, log_line)
+    match = _ISO_LOG_RE.match(log_line)
 
     if match:
         timestamp_str, level_str, message = match.groups()
         try:
-            timestamp = datetime.fromisoformat(timestamp_str.replace("Z", "+00:00"))
+            timestamp = datetime.fromisoformat(timestamp_str)
             # Ensure timezone-aware for consistent comparison
             if timestamp.tzinfo is None:
                 timestamp = timestamp.replace(tzinfo=UTC)
@@ -793,137 +963,134 @@ def _parse_log_line(log_line: str) -> tuple[datetime | None, LogLevel, str]:
             pass
 
     # Try to extract just log level from brackets anywhere in line
-    level_pattern = r"\[(\w+)\]"
-    level_match = re.search(level_pattern, log_line)
+    level_match = _BRACKET_LEVEL_RE.search(log_line)
     level = _parse_log_level(level_match.group(1)) if level_match else LogLevel.INFO
 
     return None, level, log_line
 
 
-def _should_include_log(log_entry: ServerLogEntry, logs_request: ServerLogsRequest) -> bool:
-    """Check if a log entry should be included based on filters."""
+def _should_include_log(
+    timestamp: datetime, level: LogLevel, logs_request: ServerLogsRequest
+) -> bool:
+    """Check if a parsed log line should be included based on filters."""
     # Apply time-based filters
-    if logs_request.since and log_entry.timestamp < logs_request.since:
+    if logs_request.since and timestamp < logs_request.since:
         return False
-    if logs_request.until and log_entry.timestamp > logs_request.until:
+    if logs_request.until and timestamp > logs_request.until:
         return False
 
     # Apply level filter
     if logs_request.level:
-        level_order = {
-            LogLevel.DEBUG: 0,
-            LogLevel.INFO: 1,
-            LogLevel.WARNING: 2,
-            LogLevel.ERROR: 3,
-            LogLevel.CRITICAL: 4,
-        }
-        if level_order.get(log_entry.level, 1) < level_order.get(logs_request.level, 1):
+        min_order = _LEVEL_ORDER.get(logs_request.level, 1)
+        if _LEVEL_ORDER.get(level, 1) < min_order:
             return False
 
     return True
 
 
-async def _collect_pod_logs(
-    pod: Any,
+async def _collect_container_logs(
+    pod_name: str,
+    container_name: str,
     k8s_core: client.CoreV1Api,
     logs_request: ServerLogsRequest,
     namespace_name: str,
 ) -> list[ServerLogEntry]:
-    """Collect and parse logs from a single pod."""
-    pod_name = pod.metadata.name
+    """Collect and parse logs from a single container of a pod."""
     logs: list[ServerLogEntry] = []
 
-    # Skip if filtering by pod and this isn't the one
-    if logs_request.pod_name and pod_name != logs_request.pod_name:
-        return logs
+    try:
+        # Prepare API call parameters
+        kwargs: dict[str, Any] = {
+            "name": pod_name,
+            "namespace": namespace_name,
+            "container": container_name,
+            "timestamps": True,
+            "tail_lines": logs_request.limit * 2,  # Get more for filtering
+        }
 
-    # Get container names
-    container_names = [c.name for c in pod.spec.containers]
+        # Add time-based filters if provided
+        if logs_request.since:
+            kwargs["since_seconds"] = int((datetime.now(UTC) - logs_request.since).total_seconds())
 
-    for container_name in container_names:
-        try:
-            # Prepare API call parameters
-            kwargs: dict[str, Any] = {
-                "name": pod_name,
-                "namespace": namespace_name,
-                "container": container_name,
-                "timestamps": True,
-                "tail_lines": logs_request.limit * 2,  # Get more for filtering
-            }
+        # Read logs from pod off the event loop so containers are fetched concurrently
+        log_content = await asyncio.to_thread(k8s_core.read_namespaced_pod_log, **kwargs)
 
-            # Add time-based filters if provided
-            if logs_request.since:
-                kwargs["since_seconds"] = int(
-                    (datetime.now(UTC) - logs_request.since).total_seconds()
-                )
+        logger.debug(
+            "Fetched %d bytes of logs from pod %s container %s",
+            len(log_content) if log_content else 0,
+            pod_name,
+            container_name,
+        )
 
-            # Read logs from pod
-            log_content = k8s_core.read_namespaced_pod_log(**kwargs)
+        if log_content:
+            # Parse each log line
+            lines = log_content.splitlines()
+            logger.debug("Processing %d log lines", len(lines))
 
-            logger.debug(
-                "Fetched %d bytes of logs from pod %s container %s",
-                len(log_content) if log_content else 0,
-                pod_name,
-                container_name,
-            )
+            for line in lines:
+                if not line.strip():
+                    continue
 
-            if log_content:
-                # Parse each log line
-                lines = log_content.strip().split("\n")
-                logger.debug("Processing %d log lines", len(lines))
-
-                for line in lines:
-                    if not line.strip():
-                        continue
-
-                    # Parse the log line
-                    timestamp, level, message = _parse_log_line(line)
-                    logger.debug(
-                        "Parsed line - timestamp: %s, level: %s, message: %s",
-                        timestamp,
-                        level,
-                        message[:50] if message else None,
-                    )
+                # Parse the log line
+                timestamp, level, message = _parse_log_line(line)
+
+                # Use current time if we couldn't parse timestamp
+                if timestamp is None:
+                    timestamp = datetime.now(UTC)
 
-                    # Use current time if we couldn't parse timestamp
-                    if timestamp is None:
-                        timestamp = datetime.now(UTC)
+                # Check filters on the parsed fields so rejected lines never build an entry
+                if not _should_include_log(timestamp, level, logs_request):
+                    continue
 
-                    # Create log entry
-                    log_entry = ServerLogEntry(
+                # Create log entry; all fields are already parsed and typed
+                logs.append(
+                    ServerLogEntry.model_construct(
                         timestamp=timestamp,
                         level=level,
                         message=message,
                         pod_name=pod_name,
                         container_name=container_name,
                     )
+                )
 
-                    # Check if should include based on filters
-                    should_include = _should_include_log(log_entry, logs_request)
-                    logger.debug(
-                        "Should include log entry: %s (filters - since: %s, until: %s, level: %s)",
-                        should_include,
-                        logs_request.since,
-                        logs_request.until,
-                        logs_request.level,
-                    )
-                    if should_include:
-                        logs.append(log_entry)
-
-        except ApiException as e:
-            logger.warning(
-                "Error reading logs from pod %s container %s: %s",
-                pod_name,
-                container_name,
-                e,
-            )
+    except ApiException as e:
+        logger.warning(
+            "Error reading logs from pod %s container %s: %s",
+            pod_name,
+            container_name,
+            e,
+        )
 
     return logs
 
 
+async def _collect_pod_logs(
+    pod: Any,
+    k8s_core: client.CoreV1Api,
+    logs_request: ServerLogsRequest,
+    namespace_name: str,
+) -> list[ServerLogEntry]:
+    """Collect and parse logs from all containers of a single pod."""
+    pod_name = pod.metadata.name
+
+    # Skip if filtering by pod and this isn't the one
+    if logs_request.pod_name and pod_name != logs_request.pod_name:
+        return []
+
+    container_logs = await asyncio.gather(
+        *(
+            _collect_container_logs(
+                pod_name, container.name, k8s_core, logs_request, namespace_name
+            )
+            for container in pod.spec.containers
+        )
+    )
+    return list(itertools.chain.from_iterable(container_logs))
+
+
 @router.get("/{workspace_id}/servers/{server_id:path}/logs")
 async def get_server_logs(
-    workspace_id: str,
+    workspace_id: UUID_cls,
     server_id: str,
     request: Request,
     logs_request: ServerLogsRequest = Depends(),
@@ -947,18 +1114,20 @@ async def get_server_logs(
 
     try:
         # Handle both full server names (ai.nimblebrain/echo) and simple IDs (echo)
-        actual_server_id = server_id.split("/")[-1] if "/" in server_id else server_id
+        actual_server_id = _short_id(server_id)
 
         log_operation_start("reading server logs", "server", actual_server_id)
-        k8s_core = client.CoreV1Api()
+        k8s_core = client.CoreV1Api(get_api_client())
 
         # Get pods for this server
         # The pods are labeled with app=<server_id>, not app=<server_id>-deployment
         label_selector = f"app={actual_server_id}"
 
         try:
-            pods = k8s_core.list_namespaced_pod(
-                namespace=namespace_name, label_selector=label_selector
+            pods = await asyncio.to_thread(
+                k8s_core.list_namespaced_pod,
+                namespace=namespace_name,
+                label_selector=label_selector,
             )
             logger.info(
                 "Found %d pods for server %s with label selector %s",
@@ -979,7 +1148,7 @@ async def get_server_logs(
             return ServerLogsResponse(
                 version=logs_request.version,
                 server_id=actual_server_id,
-                workspace_id=UUID_cls(workspace_id),
+                workspace_id=workspace_id,
                 logs=[],
                 count=0,
                 has_more=False,
@@ -987,24 +1156,24 @@ async def get_server_logs(
             )
 
         # Collect logs from all pods
-        all_logs: list[ServerLogEntry] = []
-        for pod in pods.items:
-            pod_logs = await _collect_pod_logs(pod, k8s_core, logs_request, namespace_name)
-            all_logs.extend(pod_logs)
-
-        # Sort logs by timestamp (newest first)
-        all_logs.sort(key=lambda x: x.timestamp, reverse=True)
+        pod_logs = await asyncio.gather(
+            *(_collect_pod_logs(pod, k8s_core, logs_request, namespace_name) for pod in pods.items)
+        )
+        all_logs = list(itertools.chain.from_iterable(pod_logs))
 
-        # Apply limit
-        has_more = len(all_logs) > logs_request.limit
-        limited_logs = all_logs[: logs_request.limit]
+        # Take the newest entries up to the limit, plus one to detect more
+        newest_logs = heapq.nlargest(
+            logs_request.limit + 1, all_logs, key=operator.attrgetter("timestamp")
+        )
+        has_more = len(newest_logs) > logs_request.limit
+        limited_logs = newest_logs[: logs_request.limit]
 
         log_operation_success("reading server logs", "server", actual_server_id)
 
         return ServerLogsResponse(
             version=logs_request.version,
             server_id=actual_server_id,
-            workspace_id=UUID_cls(workspace_id),
+            workspace_id=workspace_id,
             logs=limited_logs,
             count=len(limited_logs),
             has_more=has_more,
@@ -1022,7 +1191,7 @@ async def get_server_logs(
 
 @router.post("/{workspace_id}/servers/{server_id:path}/scale")
 async def scale_workspace_server(
-    workspace_id: str,
+    workspace_id: UUID_cls,
     server_id: str,
     scale_request: ServerScaleRequest,
     namespace_name: str = Depends(get_workspace_namespace),
@@ -1031,17 +1200,18 @@ async def scale_workspace_server(
 
     try:
         # Handle both full server names (ai.nimblebrain/echo) and simple IDs (echo)
-        actual_server_id = server_id.split("/")[-1] if "/" in server_id else server_id
+        actual_server_id = _short_id(server_id)
 
         replicas = scale_request.replicas
 
         # Scale the server
-        k8s_custom = client.CustomObjectsApi()
+        k8s_custom = client.CustomObjectsApi(get_api_client())
 
         # Patch the MCPService to update replicas
         patch_body = {"spec": {"replicas": replicas}}
 
-        k8s_custom.patch_namespaced_custom_object(
+        await asyncio.to_thread(
+            k8s_custom.patch_namespaced_custom_object,
             group="mcp.nimbletools.dev",
             version="v1",
             namespace=namespace_name,
@@ -1052,7 +1222,7 @@ async def scale_workspace_server(
 
         return ServerScaleResponse(
             server_id=actual_server_id,
-            workspace_id=UUID_cls(workspace_id),
+            workspace_id=workspace_id,
             replicas=replicas,
             status="scaled",
             message=f"Server {server_id} scaled to {replicas} replicas",
@@ -1068,7 +1238,7 @@ async def scale_workspace_server(
 
 @router.post("/{workspace_id}/servers/{server_id:path}/restart")
 async def restart_workspace_server(
-    workspace_id: str,
+    workspace_id: UUID_cls,
     server_id: str,
     restart_request: ServerRestartRequest,
     request: Request,
@@ -1078,17 +1248,17 @@ async def restart_workspace_server(
 
     try:
         # Handle both full server names (ai.nimblebrain/echo) and simple IDs (echo)
-        actual_server_id = server_id.split("/")[-1] if "/" in server_id else server_id
+        actual_server_id = _short_id(server_id)
 
         log_operation_start("restarting server", "server", actual_server_id)
-        k8s_apps = client.AppsV1Api()
+        k8s_apps = client.AppsV1Api(get_api_client())
 
         deployment_name = f"{actual_server_id}-deployment"
 
         # Check if deployment exists
         try:
-            deployment = k8s_apps.read_namespaced_deployment(
-                name=deployment_name, namespace=namespace_name
+            deployment = await asyncio.to_thread(
+                k8s_apps.read_namespaced_deployment, name=deployment_name, namespace=namespace_name
             )
         except ApiException as e:
             if e.status == 404:
@@ -1113,13 +1283,14 @@ async def restart_workspace_server(
         )
 
         # Add restart annotation with current timestamp to trigger rolling restart
-        restart_time = datetime.utcnow().isoformat()
-        pod_annotations["kubectl.kubernetes.io/restartedAt"] = restart_time
+        restart_time = datetime.now(UTC).isoformat()
+        pod_annotations[_RESTART_ANNOTATION] = restart_time
 
         # Patch the deployment's pod template to trigger rolling restart
         patch_body = {"spec": {"template": {"metadata": {"annotations": pod_annotations}}}}
 
-        k8s_apps.patch_namespaced_deployment(
+        await asyncio.to_thread(
+            k8s_apps.patch_namespaced_deployment,
             name=deployment_name,
             namespace=namespace_name,
             body=patch_body,
@@ -1128,17 +1299,18 @@ async def restart_workspace_server(
         # Also trigger operator reprocessing by updating MCPService
         # This ensures secrets added after deployment are picked up
         try:
-            k8s_custom = client.CustomObjectsApi()
+            k8s_custom = client.CustomObjectsApi(get_api_client())
             mcpservice_patch = {
                 "metadata": {
                     "annotations": {
-                        "kubectl.kubernetes.io/restartedAt": restart_time,
+                        _RESTART_ANNOTATION: restart_time,
                         "mcp.nimbletools.dev/reprocess-secrets": restart_time,
                     }
                 }
             }
 
-            k8s_custom.patch_namespaced_custom_object(
+            await asyncio.to_thread(
+                k8s_custom.patch_namespaced_custom_object,
                 group="mcp.nimbletools.dev",
                 version="v1",
                 namespace=namespace_name,
@@ -1162,7 +1334,7 @@ async def restart_workspace_server(
 
         return ServerRestartResponse(
             server_id=actual_server_id,
-            workspace_id=UUID_cls(workspace_id),
+            workspace_id=workspace_id,
             status="restarting",
             message=f"Server {server_id} restart initiated successfully",
             timestamp=datetime.now(UTC),
@@ -1177,7 +1349,7 @@ async def restart_workspace_server(
 
 @router.get("/{workspace_id}/servers/{server_id:path}")
 async def get_workspace_server(
-    workspace_id: str,
+    workspace_id: UUID_cls,
     server_id: str,
     request: Request,
     namespace_name: str = Depends(get_workspace_namespace),
@@ -1186,54 +1358,35 @@ async def get_workspace_server(
 
     try:
         # Handle both full server names (ai.nimblebrain/echo) and simple IDs (echo)
-        # If the server_id contains a slash, extract just the last part
-        if "/" in server_id:
-            actual_server_id = server_id.split("/")[-1]
+        actual_server_id = _short_id(server_id)
+        if actual_server_id != server_id:
             logger.debug(
                 "Extracting server ID from full name: %s -> %s", server_id, actual_server_id
             )
-        else:
-            actual_server_id = server_id
 
         log_operation_start("reading server details", "server", actual_server_id)
-        k8s_custom = client.CustomObjectsApi()
+        k8s_custom = client.CustomObjectsApi(get_api_client())
 
-        # Get MCPService
-        mcpservice = k8s_custom.get_namespaced_custom_object(
-            group="mcp.nimbletools.dev",
-            version="v1",
-            namespace=namespace_name,
-            plural="mcpservices",
-            name=actual_server_id,
+        # Get MCPService, Deployment and Service concurrently. The MCPService is
+        # required; the Deployment and Service may not exist yet.
+        fetched: tuple[Any, Any, Any] = await asyncio.gather(
+            asyncio.to_thread(
+                k8s_custom.get_namespaced_custom_object,
+                group="mcp.nimbletools.dev",
+                version="v1",
+                namespace=namespace_name,
+                plural="mcpservices",
+                name=actual_server_id,
+            ),
+            get_deployment_if_exists(f"{actual_server_id}-deployment", namespace_name),
+            get_service_if_exists(f"{actual_server_id}-service", namespace_name),
+            return_exceptions=True,
         )
-
-        # Get Deployment status (optional - may not exist yet)
-        deployment = None
-        try:
-            deployment = await get_deployment_if_exists(
-                f"{actual_server_id}-deployment", namespace_name
-            )
-        except KubernetesOperationError as e:
-            logger.warning(
-                "Kubernetes error getting deployment for server %s: %s", actual_server_id, e.message
-            )
-        except Exception as e:
-            logger.warning(
-                "Unexpected error getting deployment for server %s: %s", actual_server_id, e
-            )
-
-        # Get Service (optional - may not exist yet)
-        service = None
-        try:
-            service = await get_service_if_exists(f"{actual_server_id}-service", namespace_name)
-        except KubernetesOperationError as e:
-            logger.warning(
-                "Kubernetes error getting service for server %s: %s", actual_server_id, e.message
-            )
-        except Exception as e:
-            logger.warning(
-                "Unexpected error getting service for server %s: %s", actual_server_id, e
-            )
+        mcpservice = fetched[0]
+        if isinstance(mcpservice, BaseException):
+            raise mcpservice
+        deployment = _optional_resource_or_none(fetched[1], "deployment", actual_server_id)
+        service = _optional_resource_or_none(fetched[2], "service", actual_server_id)
 
         spec = mcpservice.get("spec", {})
 
@@ -1242,25 +1395,21 @@ async def get_workspace_server(
             deployment, namespace_name, actual_server_id
         )
 
+        deployment_status = deployment.status if deployment else None
+        ready_replicas = deployment_status.ready_replicas if deployment_status else 0
+
         return ServerDetailsResponse(
             id=actual_server_id,
             name=actual_server_id,
-            workspace_id=UUID_cls(workspace_id),
+            workspace_id=workspace_id,
             namespace=namespace_name,
             image=spec.get("container", {}).get("image", ""),
             spec=spec,
             status={
                 "phase": deployment_phase,
-                "deployment_ready": (
-                    deployment
-                    and deployment.status
-                    and deployment.status.ready_replicas
-                    and deployment.status.ready_replicas > 0
-                ),
-                "replicas": deployment.status.replicas if deployment and deployment.status else 0,
-                "ready_replicas": (
-                    deployment.status.ready_replicas if deployment and deployment.status else 0
-                ),
+                "deployment_ready": bool(ready_replicas and ready_replicas > 0),
+                "replicas": deployment_status.replicas if deployment_status else 0,
+                "ready_replicas": ready_replicas,
                 "service_endpoint": (
                     f"/{workspace_id}/{actual_server_id}/mcp" if service else None
                 ),
@@ -1277,7 +1426,7 @@ async def get_workspace_server(
 
 @router.delete("/{workspace_id}/servers/{server_id:path}")
 async def remove_workspace_server(
-    workspace_id: str,
+    workspace_id: UUID_cls,
     server_id: str,
     request: Request,
     namespace_name: str = Depends(get_workspace_namespace),
@@ -1286,13 +1435,14 @@ async def remove_workspace_server(
 
     try:
         # Handle both full server names (ai.nimblebrain/echo) and simple IDs (echo)
-        actual_server_id = server_id.split("/")[-1] if "/" in server_id else server_id
+        actual_server_id = _short_id(server_id)
 
         log_operation_start("removing server", "server", actual_server_id)
-        k8s_custom = client.CustomObjectsApi()
+        k8s_custom = client.CustomObjectsApi(get_api_client())
 
         # Delete the MCPService - operator will handle cleanup of all resources
-        k8s_custom.delete_namespaced_custom_object(
+        await asyncio.to_thread(
+            k8s_custom.delete_namespaced_custom_object,
             group="mcp.nimbletools.dev",
             version="v1",
             namespace=namespace_name,
@@ -1304,7 +1454,7 @@ async def remove_workspace_server(
 
         return ServerDeleteResponse(
             server_id=actual_server_id,
-            workspace_id=UUID_cls(workspace_id),
+            workspace_id=workspace_id,
             namespace=namespace_name,
             status="removed",
             message=f"Server {server_id} removed successfully",
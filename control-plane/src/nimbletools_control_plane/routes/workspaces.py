@@ -2,8 +2,10 @@
 Workspace Router for NimbleTools Control Plane
 """
 
+import asyncio
 import base64
 import logging
+import time
 from datetime import UTC, datetime
 from typing import Any
 from uuid import UUID as UUID_cls
@@ -18,6 +20,7 @@ from nimbletools_control_plane.exceptions import (
     log_operation_start,
     log_operation_success,
 )
+from nimbletools_control_plane.k8s_clients import get_api_client
 from nimbletools_control_plane.models import (
     WorkspaceCreateRequest,
     WorkspaceCreateResponse,
@@ -27,6 +30,7 @@ from nimbletools_control_plane.models import (
     WorkspaceSecretResponse,
     WorkspaceSecretSetRequest,
     WorkspaceSecretsResponse,
+    WorkspaceSecretsSetRequest,
     WorkspaceSummary,
 )
 from nimbletools_control_plane.workspace_utils import generate_workspace_identifiers
@@ -34,6 +38,97 @@ from nimbletools_control_plane.workspace_utils import generate_workspace_identif
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/v1/workspaces", tags=["workspaces"])
 
+# Label and annotation keys stamped on workspace namespaces and secrets
+_LABEL_WORKSPACE = "mcp.nimbletools.dev/workspace"
+_LABEL_WORKSPACE_ID = "mcp.nimbletools.dev/workspace_id"
+_LABEL_WORKSPACE_NAME = "mcp.nimbletools.dev/workspace_name"
+_LABEL_USER_ID = "mcp.nimbletools.dev/user_id"
+_LABEL_ORGANIZATION_ID = "mcp.nimbletools.dev/organization_id"
+_LABEL_UNIQUE_KEY = "mcp.nimbletools.dev/unique_key"
+_LABEL_MANAGED_BY = "mcp.nimbletools.dev/managed-by"
+_ANNOTATION_CREATED = "mcp.nimbletools.dev/created"
+_MANAGED_BY_CONTROL_PLANE = "nimbletools-control-plane"
+
+# Label selectors, built once; the organization selector takes the org ID
+_ORG_WORKSPACES_SELECTOR = f"{_LABEL_WORKSPACE}=true,{_LABEL_ORGANIZATION_ID}={{}}"
+_UNIQUE_WORKSPACE_SELECTOR = f"{_LABEL_WORKSPACE}=true,{_LABEL_UNIQUE_KEY}={{}}"
+_MANAGED_SECRETS_SELECTOR = f"{_LABEL_MANAGED_BY}={_MANAGED_BY_CONTROL_PLANE}"
+
+# Every workspace secret is a key in this one Secret in the workspace namespace
+_WORKSPACE_SECRET_NAME = "workspace-secrets"
+
+# Workspace listings are reused for a few seconds so bursty dashboards don't
+# relist namespaces on every request. Entries map a label selector to
+# (expiry from time.monotonic(), namespaces), are stored once the list call
+# completes, and are dropped whenever this process creates or deletes a
+# workspace.
+_WORKSPACE_LIST_TTL_SECONDS = 5.0
+_WORKSPACE_LIST_CACHE_MAXSIZE = 1024
+# Namespaces fetched per list request, so a large organization is paged
+# through rather than returned in one response
+_WORKSPACE_LIST_PAGE_SIZE = 500
+_workspace_list_cache: dict[str, tuple[float, list[Any]]] = {}
+# Bumped on every invalidation so a list that was in flight across a create or
+# delete doesn't store its now-stale result.
+_workspace_list_generation = 0
+
+
+def _invalidate_workspace_list_cache() -> None:
+    """Drop cached workspace listings after a workspace is created or deleted."""
+    global _workspace_list_generation  # noqa: PLW0603
+
+    _workspace_list_generation += 1
+    _workspace_list_cache.clear()
+
+
+async def _list_workspace_namespaces(k8s_core: client.CoreV1Api, label_selector: str) -> list[Any]:
+    """List workspace namespaces matching a label selector, reusing fresh results."""
+    cached = _workspace_list_cache.get(label_selector)
+    if cached is not None and cached[0] > time.monotonic():
+        return cached[1]
+
+    generation = _workspace_list_generation
+    namespaces: list[Any] = []
+    list_kwargs: dict[str, Any] = {
+        "label_selector": label_selector,
+        "limit": _WORKSPACE_LIST_PAGE_SIZE,
+    }
+    while True:
+        page = await asyncio.to_thread(k8s_core.list_namespace, **list_kwargs)
+        namespaces.extend(page.items)
+        continue_token = page.metadata._continue
+        if not continue_token:
+            break
+        list_kwargs["_continue"] = continue_token
+    if generation != _workspace_list_generation:
+        return namespaces
+
+    if len(_workspace_list_cache) >= _WORKSPACE_LIST_CACHE_MAXSIZE:
+        _workspace_list_cache.clear()
+    _workspace_list_cache[label_selector] = (
+        time.monotonic() + _WORKSPACE_LIST_TTL_SECONDS,
+        namespaces,
+    )
+    return namespaces
+
+
+def _get_user_identity(user: dict[str, Any]) -> tuple[str, str]:
+    """Return the (user_id, organization_id) of the authenticated user.
+
+    Raises a 401 HTTPException if either is missing.
+    """
+    user_id = user.get("user_id")
+    if not user_id:
+        raise HTTPException(status_code=401, detail="User authentication failed: missing user_id")
+
+    organization_id = user.get("organization_id")
+    if not organization_id:
+        raise HTTPException(
+            status_code=401, detail="User authentication failed: missing organization_id"
+        )
+
+    return str(user_id), str(organization_id)
+
 
 @router.post("")
 async def create_workspace(
@@ -46,35 +141,28 @@ async def create_workspace(
         workspace_name_base = workspace_request.name
 
         # Get user ID and organization ID from authenticated user context
-        user_id = user.get("user_id")
-        if not user_id:
-            raise HTTPException(
-                status_code=401, detail="User authentication failed: missing user_id"
-            )
-        user_id_str = str(user_id)
-
-        organization_id = user.get("organization_id")
-        if not organization_id:
-            raise HTTPException(
-                status_code=401, detail="User authentication failed: missing organization_id"
-            )
-        organization_id_str = str(organization_id)
+        user_id_str, organization_id_str = _get_user_identity(user)
 
         # Create Kubernetes client
-        k8s_core = client.CoreV1Api()
+        k8s_core = client.CoreV1Api(get_api_client())
 
         # Check if a workspace with the same name already exists in this organization
         # We use a composite label to ensure uniqueness within an org
         # Note: Using dash instead of colon as Kubernetes labels don't allow colons
         unique_workspace_key = f"{workspace_name_base}-{organization_id_str}"
 
-        # Check for existing workspace with same name in this org
-        label_selector = f"mcp.nimbletools.dev/workspace=true,mcp.nimbletools.dev/organization_id={organization_id_str}"
-        existing_namespaces = k8s_core.list_namespace(label_selector=label_selector)
+        # Check for existing workspace with same name in this org. Namespace
+        # names carry a fresh UUID, so create_namespace can't detect duplicates;
+        # let the API server match the unique key and return at most one match
+        # instead of every workspace in the org.
+        label_selector = _UNIQUE_WORKSPACE_SELECTOR.format(unique_workspace_key)
+        existing_namespaces = await asyncio.to_thread(
+            k8s_core.list_namespace, label_selector=label_selector, limit=1
+        )
 
         for ns in existing_namespaces.items:
             existing_labels = ns.metadata.labels or {}
-            existing_unique_key = existing_labels.get("mcp.nimbletools.dev/unique_key")
+            existing_unique_key = existing_labels.get(_LABEL_UNIQUE_KEY)
             if existing_unique_key == unique_workspace_key:
                 logger.warning(
                     "User %s attempted to create duplicate workspace '%s' in org %s",
@@ -98,18 +186,19 @@ async def create_workspace(
 
         # Build labels
         labels = {
-            "mcp.nimbletools.dev/workspace": "true",
-            "mcp.nimbletools.dev/workspace_id": workspace_id,
-            "mcp.nimbletools.dev/workspace_name": workspace_name,  # Store the user-provided workspace name
-            "mcp.nimbletools.dev/user_id": user_id_str,  # Standardized field for workspace owner
-            "mcp.nimbletools.dev/organization_id": organization_id_str,
-            "mcp.nimbletools.dev/unique_key": unique_workspace_key,  # Composite key for uniqueness
+            _LABEL_WORKSPACE: "true",
+            _LABEL_WORKSPACE_ID: workspace_id,
+            _LABEL_WORKSPACE_NAME: workspace_name,  # Store the user-provided workspace name
+            _LABEL_USER_ID: user_id_str,  # Standardized field for workspace owner
+            _LABEL_ORGANIZATION_ID: organization_id_str,
+            _LABEL_UNIQUE_KEY: unique_workspace_key,  # Composite key for uniqueness
         }
 
-        # Build annotations
+        # Build annotations; the same timestamp is reported in the response
+        created_at = datetime.now(UTC)
         annotations = {
-            "mcp.nimbletools.dev/created": datetime.now(UTC).isoformat(),
-            "mcp.nimbletools.dev/organization_id": organization_id_str,
+            _ANNOTATION_CREATED: created_at.isoformat(),
+            _LABEL_ORGANIZATION_ID: organization_id_str,
         }
 
         namespace = client.V1Namespace(
@@ -120,7 +209,8 @@ async def create_workspace(
             )
         )
 
-        k8s_core.create_namespace(namespace)
+        await asyncio.to_thread(k8s_core.create_namespace, namespace)
+        _invalidate_workspace_list_cache()
         logger.info("Created workspace namespace: %s", namespace_name)
 
         # Parse user_id and org_id back to UUID for response
@@ -130,7 +220,7 @@ async def create_workspace(
             namespace=namespace_name,
             user_id=UUID_cls(user_id_str),
             organization_id=UUID_cls(organization_id_str),
-            created_at=datetime.now(UTC),
+            created_at=created_at,
             status="ready",
             message=f"Workspace '{workspace_name}' created successfully",
         )
@@ -153,39 +243,29 @@ async def list_workspaces(
 ) -> WorkspaceListResponse:
     """List workspaces"""
     try:
-        k8s_core = client.CoreV1Api()
+        k8s_core = client.CoreV1Api(get_api_client())
 
         # Get user ID and organization ID for filtering
-        user_id = user.get("user_id")
-        if not user_id:
-            raise HTTPException(
-                status_code=401, detail="User authentication failed: missing user_id"
-            )
-
-        organization_id = user.get("organization_id")
-        if not organization_id:
-            raise HTTPException(
-                status_code=401, detail="User authentication failed: missing organization_id"
-            )
+        user_id, organization_id = _get_user_identity(user)
 
         # Filter workspaces by organization_id
         # This ensures users only see workspaces from their organization
-        label_selector = f"mcp.nimbletools.dev/workspace=true,mcp.nimbletools.dev/organization_id={organization_id}"
-        namespaces = k8s_core.list_namespace(label_selector=label_selector)
+        label_selector = _ORG_WORKSPACES_SELECTOR.format(organization_id)
+        namespaces = await _list_workspace_namespaces(k8s_core, label_selector)
 
         workspaces = []
-        for ns in namespaces.items:
+        for ns in namespaces:
             labels = ns.metadata.labels or {}
             annotations = ns.metadata.annotations or {}
 
             # Read workspace_id from label (required)
-            workspace_id = labels.get("mcp.nimbletools.dev/workspace_id")
+            workspace_id = labels.get(_LABEL_WORKSPACE_ID)
             if not workspace_id:
                 logger.error("Namespace %s missing workspace_id label, skipping", ns.metadata.name)
                 continue  # Skip workspaces without proper labels
 
             # Read workspace_name from label (required)
-            workspace_name = labels.get("mcp.nimbletools.dev/workspace_name")
+            workspace_name = labels.get(_LABEL_WORKSPACE_NAME)
             if not workspace_name:
                 logger.error(
                     "Namespace %s missing workspace_name label, skipping", ns.metadata.name
@@ -193,7 +273,7 @@ async def list_workspaces(
                 continue
 
             # Parse timestamps
-            created_str = annotations.get("mcp.nimbletools.dev/created")
+            created_str = annotations.get(_ANNOTATION_CREATED)
             if not created_str and ns.metadata.creation_timestamp:
                 created_str = ns.metadata.creation_timestamp.isoformat()
             created_dt = (
@@ -201,12 +281,12 @@ async def list_workspaces(
             )
 
             # Get user_id and organization_id (both required)
-            user_id_str = labels.get("mcp.nimbletools.dev/user_id")
+            user_id_str = labels.get(_LABEL_USER_ID)
             if not user_id_str:
                 logger.error("Namespace %s missing user_id label, skipping", ns.metadata.name)
                 continue
 
-            org_id_str = labels.get("mcp.nimbletools.dev/organization_id")
+            org_id_str = labels.get(_LABEL_ORGANIZATION_ID)
             if not org_id_str:
                 logger.error(
                     "Namespace %s missing organization_id label, skipping", ns.metadata.name
@@ -246,18 +326,18 @@ async def list_workspaces(
 async def get_workspace_details(
     workspace_id: str,
     _request: Request,
-    namespace_name: str = Depends(auth.get_workspace_namespace),
+    namespace: client.V1Namespace = Depends(auth.get_workspace_namespace_object),
 ) -> WorkspaceDetailsResponse:
     """Get workspace details - authentication and access handled by dependency"""
 
     try:
-        k8s_core = client.CoreV1Api()
-        namespace = k8s_core.read_namespace(namespace_name)
+        # The access dependency already fetched the namespace; no second read
+        namespace_name = namespace.metadata.name
         labels = namespace.metadata.labels or {}
         annotations = namespace.metadata.annotations or {}
 
         # Read workspace_name from label (required)
-        workspace_name = labels.get("mcp.nimbletools.dev/workspace_name")
+        workspace_name = labels.get(_LABEL_WORKSPACE_NAME)
         if not workspace_name:
             raise HTTPException(
                 status_code=500,
@@ -265,7 +345,7 @@ async def get_workspace_details(
             )
 
         # Verify workspace_id exists and matches what's in the label
-        label_workspace_id = labels.get("mcp.nimbletools.dev/workspace_id")
+        label_workspace_id = labels.get(_LABEL_WORKSPACE_ID)
         if not label_workspace_id:
             raise HTTPException(
                 status_code=500,
@@ -280,19 +360,19 @@ async def get_workspace_details(
             raise HTTPException(status_code=500, detail="Workspace configuration error")
 
         # Parse timestamps
-        created_str = annotations.get("mcp.nimbletools.dev/created")
+        created_str = annotations.get(_ANNOTATION_CREATED)
         created_dt = (
             datetime.fromisoformat(created_str.replace("Z", "+00:00")) if created_str else None
         )
 
         # Get user_id and organization_id (both required)
-        user_id_str = labels.get("mcp.nimbletools.dev/user_id")
+        user_id_str = labels.get(_LABEL_USER_ID)
         if not user_id_str:
             raise HTTPException(
                 status_code=500, detail=f"Workspace {workspace_id} missing required user_id label"
             )
 
-        org_id_str = labels.get("mcp.nimbletools.dev/organization_id")
+        org_id_str = labels.get(_LABEL_ORGANIZATION_ID)
         if not org_id_str:
             raise HTTPException(
                 status_code=500,
@@ -326,11 +406,12 @@ async def delete_workspace(
     """Delete workspace - authentication and access handled by dependency"""
 
     try:
-        k8s_core = client.CoreV1Api()
+        k8s_core = client.CoreV1Api(get_api_client())
 
         log_operation_start("deleting workspace", "workspace", workspace_id)
         # Delete the namespace (cascades to all resources)
-        k8s_core.delete_namespace(namespace_name)
+        await asyncio.to_thread(k8s_core.delete_namespace, namespace_name)
+        _invalidate_workspace_list_cache()
         logger.info("Deleted workspace namespace: %s", namespace_name)
 
         result = WorkspaceDeleteResponse(
@@ -361,12 +442,13 @@ async def list_workspace_secrets(
 
     try:
         log_operation_start("listing secrets", "workspace", workspace_id)
-        k8s_core = client.CoreV1Api()
+        k8s_core = client.CoreV1Api(get_api_client())
 
         # List all secrets in the workspace namespace that are managed by us
-        secrets = k8s_core.list_namespaced_secret(
+        secrets = await asyncio.to_thread(
+            k8s_core.list_namespaced_secret,
             namespace=namespace_name,
-            label_selector="mcp.nimbletools.dev/managed-by=nimbletools-control-plane",
+            label_selector=_MANAGED_SECRETS_SELECTOR,
         )
 
         secret_keys = []
@@ -390,6 +472,102 @@ async def list_workspace_secrets(
         raise convert_to_http_exception(e, default_status_code=500)
 
 
+def _encode_secret_value(value: str) -> str:
+    """Base64-encode a secret value as Kubernetes expects in Secret data"""
+    return base64.b64encode(value.encode("utf-8")).decode("utf-8")
+
+
+async def _merge_workspace_secret_data(
+    k8s_core: client.CoreV1Api,
+    namespace_name: str,
+    workspace_id: str,
+    data: dict[str, str],
+) -> None:
+    """Merge encoded keys into the workspace secret, creating it if it doesn't exist.
+
+    A strategic merge patch carrying only the given keys updates them in one
+    request, without reading the secret first or resending the other keys.
+    """
+    try:
+        await asyncio.to_thread(
+            k8s_core.patch_namespaced_secret,
+            name=_WORKSPACE_SECRET_NAME,
+            namespace=namespace_name,
+            body={"data": data},
+        )
+        return
+    except ApiException as e:
+        if e.status != 404:
+            raise
+
+    secret_manifest = client.V1Secret(
+        metadata=client.V1ObjectMeta(
+            name=_WORKSPACE_SECRET_NAME,
+            namespace=namespace_name,
+            labels={
+                _LABEL_MANAGED_BY: _MANAGED_BY_CONTROL_PLANE,
+                _LABEL_WORKSPACE: workspace_id,
+            },
+            annotations={
+                _ANNOTATION_CREATED: datetime.now(UTC).isoformat(),
+            },
+        ),
+        data=data,
+        type="Opaque",
+    )
+    try:
+        await asyncio.to_thread(
+            k8s_core.create_namespaced_secret,
+            namespace=namespace_name,
+            body=secret_manifest,
+        )
+    except ApiException as e:
+        if e.status != 409:
+            raise
+        # A concurrent request created the secret first; merge into it instead
+        await asyncio.to_thread(
+            k8s_core.patch_namespaced_secret,
+            name=_WORKSPACE_SECRET_NAME,
+            namespace=namespace_name,
+            body={"data": data},
+        )
+
+
+@router.put("/{workspace_id}/secrets")
+async def set_workspace_secrets(
+    workspace_id: str,
+    secrets_request: WorkspaceSecretsSetRequest,
+    request: Request,
+    namespace_name: str = Depends(auth.get_workspace_namespace),
+) -> WorkspaceSecretsResponse:
+    """Set several secrets for a workspace in one request"""
+
+    try:
+        log_operation_start("setting secrets", "workspace", workspace_id)
+        k8s_core = client.CoreV1Api(get_api_client())
+
+        encoded_data = {
+            key: _encode_secret_value(value) for key, value in secrets_request.secrets.items()
+        }
+        await _merge_workspace_secret_data(k8s_core, namespace_name, workspace_id, encoded_data)
+
+        secret_keys = sorted(encoded_data)
+        logger.info("Set %d secrets in workspace %s", len(secret_keys), workspace_id)
+        log_operation_success("setting secrets", "workspace", workspace_id)
+        return WorkspaceSecretsResponse(
+            workspace_id=UUID_cls(workspace_id),
+            secrets=secret_keys,
+            count=len(secret_keys),
+            message=f"{len(secret_keys)} secrets set successfully",
+        )
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error("Error setting secrets for workspace %s: %s", workspace_id, e)
+        raise convert_to_http_exception(e, default_status_code=500)
+
+
 @router.put("/{workspace_id}/secrets/{secret_key}")
 async def set_workspace_secret(
     workspace_id: str,
@@ -402,55 +580,16 @@ async def set_workspace_secret(
 
     try:
         log_operation_start("setting secret", "workspace", workspace_id)
-        k8s_core = client.CoreV1Api()
-
-        # Create or update the secret in the workspace namespace
-        secret_name = "workspace-secrets"
+        k8s_core = client.CoreV1Api(get_api_client())
 
-        # Encode the secret value in base64 as required by Kubernetes
-        encoded_value = base64.b64encode(secret_request.secret_value.encode("utf-8")).decode(
-            "utf-8"
+        # Create or update just this key in the workspace secret
+        await _merge_workspace_secret_data(
+            k8s_core,
+            namespace_name,
+            workspace_id,
+            {secret_key: _encode_secret_value(secret_request.secret_value)},
         )
-
-        try:
-            # Try to get existing secret
-            existing_secret = k8s_core.read_namespaced_secret(
-                name=secret_name, namespace=namespace_name
-            )
-
-            # Update existing secret
-            if existing_secret.data is None:
-                existing_secret.data = {}
-            existing_secret.data[secret_key] = encoded_value
-
-            k8s_core.patch_namespaced_secret(
-                name=secret_name, namespace=namespace_name, body=existing_secret
-            )
-            logger.info("Updated secret %s in workspace %s", secret_key, workspace_id)
-
-        except ApiException as e:
-            if e.status == 404:
-                # Create new secret
-                secret_manifest = client.V1Secret(
-                    metadata=client.V1ObjectMeta(
-                        name=secret_name,
-                        namespace=namespace_name,
-                        labels={
-                            "mcp.nimbletools.dev/managed-by": "nimbletools-control-plane",
-                            "mcp.nimbletools.dev/workspace": workspace_id,
-                        },
-                        annotations={
-                            "mcp.nimbletools.dev/created": datetime.now(UTC).isoformat(),
-                        },
-                    ),
-                    data={secret_key: encoded_value},
-                    type="Opaque",
-                )
-
-                k8s_core.create_namespaced_secret(namespace=namespace_name, body=secret_manifest)
-                logger.info("Created secret %s in workspace %s", secret_key, workspace_id)
-            else:
-                raise
+        logger.info("Set secret %s in workspace %s", secret_key, workspace_id)
 
         log_operation_success("setting secret", "workspace", workspace_id)
         return WorkspaceSecretResponse(
@@ -478,14 +617,14 @@ async def delete_workspace_secret(
 
     try:
         log_operation_start("deleting secret", "workspace", workspace_id)
-        k8s_core = client.CoreV1Api()
+        k8s_core = client.CoreV1Api(get_api_client())
 
-        secret_name = "workspace-secrets"
+        secret_name = _WORKSPACE_SECRET_NAME
 
         try:
             # Get the existing secret
-            existing_secret = k8s_core.read_namespaced_secret(
-                name=secret_name, namespace=namespace_name
+            existing_secret = await asyncio.to_thread(
+                k8s_core.read_namespaced_secret, name=secret_name, namespace=namespace_name
             )
 
             if existing_secret.data is None or secret_key not in existing_secret.data:
@@ -499,12 +638,17 @@ async def delete_workspace_secret(
 
             # If no more secrets remain, delete the entire secret resource
             if not existing_secret.data:
-                k8s_core.delete_namespaced_secret(name=secret_name, namespace=namespace_name)
+                await asyncio.to_thread(
+                    k8s_core.delete_namespaced_secret, name=secret_name, namespace=namespace_name
+                )
                 logger.info("Deleted empty secret resource for workspace %s", workspace_id)
             else:
                 # Update the secret without the deleted key
-                k8s_core.patch_namespaced_secret(
-                    name=secret_name, namespace=namespace_name, body=existing_secret
+                await asyncio.to_thread(
+                    k8s_core.patch_namespaced_secret,
+                    name=secret_name,
+                    namespace=namespace_name,
+                    body=existing_secret,
                 )
                 logger.info("Removed secret %s from workspace %s", secret_key, workspace_id)
 
@@ -7,6 +7,21 @@ import pytest
 from fastapi.testclient import TestClient
 
 from nimbletools_control_plane.main import app
+from nimbletools_control_plane.routes import servers, workspaces
+
+
+@pytest.fixture(autouse=True)
+def reset_cluster_architecture_cache():
+    """Keep the cached cluster architecture from leaking between tests."""
+    with patch.object(servers, "_cluster_arch_cache", None):
+        yield
+
+
+@pytest.fixture(autouse=True)
+def reset_workspace_list_cache():
+    """Keep cached workspace listings from leaking between tests."""
+    with patch.object(workspaces, "_workspace_list_cache", {}):
+        yield
 
 
 @pytest.fixture
@@ -0,0 +1,24 @@
+"""Tests for the shared Kubernetes API client."""
+
+from unittest.mock import patch
+
+from nimbletools_control_plane import k8s_clients
+
+
+def test_get_api_client_is_shared():
+    """Test that successive calls return the same API client."""
+    with patch.object(k8s_clients, "_api_client", None):
+        first = k8s_clients.get_api_client()
+        second = k8s_clients.get_api_client()
+
+        assert first is second
+
+
+def test_get_api_client_sets_pool_maxsize():
+    """Test that the shared API client uses the configured pool size."""
+    with patch.object(k8s_clients, "_api_client", None):
+        api_client = k8s_clients.get_api_client()
+
+        assert (
+            api_client.configuration.connection_pool_maxsize == k8s_clients.CONNECTION_POOL_MAXSIZE
+        )
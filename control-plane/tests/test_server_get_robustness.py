@@ -17,7 +17,7 @@ class TestServerGetRobustness:
     @pytest.fixture
     def mock_workspace_id(self):
         """Mock workspace ID."""
-        return "f33ae45a-f171-46da-b78e-2b4feca6dded"
+        return UUID("f33ae45a-f171-46da-b78e-2b4feca6dded")
 
     @pytest.fixture
     def mock_namespace_name(self):
@@ -102,7 +102,7 @@ class TestServerGetRobustness:
 
                     # Should still return server details with degraded deployment info
                     assert result.id == server_id
-                    assert result.workspace_id == UUID(mock_workspace_id)
+                    assert result.workspace_id == mock_workspace_id
                     assert result.status["deployment_ready"] in [
                         False,
                         None,
@@ -19,9 +19,11 @@ from nimbletools_control_plane.routes.servers import (
     _build_labels_and_annotations,
     _build_resources_config,
     _build_scaling_config,
+    _create_mcpservice_spec_from_mcp_server,
     _extract_container_config,
     _extract_mcpb_filename,
     _find_mcpb_package_for_arch,
+    _get_cluster_architecture,
     _serialize_packages,
     _validate_mcpb_packages,
     deploy_server_to_workspace,
@@ -187,6 +189,38 @@ class TestFindMcpbPackageForArch:
         assert result == mcpb_package
 
 
+class TestGetClusterArchitecture:
+    """Test _get_cluster_architecture helper function."""
+
+    @staticmethod
+    def _node_list(arch: str) -> Mock:
+        node = Mock()
+        node.metadata.labels = {"kubernetes.io/arch": arch}
+        return Mock(items=[node])
+
+    def test_detected_architecture_is_cached(self):
+        """Test that a detected architecture is reused without listing nodes again."""
+        with patch("nimbletools_control_plane.routes.servers.client.CoreV1Api") as mock_core_api:
+            mock_core_api.return_value.list_node.return_value = self._node_list("arm64")
+
+            assert _get_cluster_architecture() == "arm64"
+            assert _get_cluster_architecture() == "arm64"
+
+            mock_core_api.return_value.list_node.assert_called_once_with(limit=1)
+
+    def test_failed_detection_is_not_cached(self):
+        """Test that the amd64 fallback on errors is not cached."""
+        with patch("nimbletools_control_plane.routes.servers.client.CoreV1Api") as mock_core_api:
+            mock_core_api.return_value.list_node.side_effect = [
+                ApiException(status=403),
+                self._node_list("arm64"),
+            ]
+
+            assert _get_cluster_architecture() == "amd64"
+            assert _get_cluster_architecture() == "arm64"
+            assert mock_core_api.return_value.list_node.call_count == 2
+
+
 class TestExtractContainerConfig:
     """Test _extract_container_config helper function."""
 
@@ -481,6 +515,12 @@ class TestBuildScalingConfig:
             "customField": "value",  # Added by user
         }
 
+    def test_build_scaling_config_does_not_mutate_defaults(self):
+        """Test that overrides never leak into later calls."""
+        _build_scaling_config(None, {"maxReplicas": 20})
+
+        assert _build_scaling_config(None, None)["maxReplicas"] == 10
+
 
 class TestBuildLabelsAndAnnotations:
     """Test _build_labels_and_annotations helper function."""
@@ -579,6 +619,50 @@ class TestBuildLabelsAndAnnotations:
         assert labels["mcp.nimbletools.dev/server-name"] == "provider-category-my-server"
 
 
+class TestCreateMcpserviceSpecRouting:
+    """Test routing config built by _create_mcpservice_spec_from_mcp_server."""
+
+    @pytest.fixture
+    def oci_server(self):
+        """Minimal OCI-packaged server."""
+        return MCPServer(
+            name="ai.nimbletools/echo",
+            version="1.0.0",
+            description="Echo server for testing",
+            packages=[
+                {
+                    "registryType": "oci",
+                    "identifier": "nimbletools/echo",
+                    "version": "1.0.0",
+                    "transport": {"type": "streamable-http"},
+                }
+            ],
+        )
+
+    def test_routing_defaults(self, oci_server):
+        """Test default routing for a server without runtime overrides."""
+        spec = _create_mcpservice_spec_from_mcp_server(oci_server, "ws-id", "ws-ns")
+
+        assert spec["spec"]["routing"] == {
+            "path": "/services/echo",
+            "port": 8000,
+            "healthPath": "/health",
+            "healthCheck": True,
+            "mcpPath": "/mcp",
+            "discoveryPath": "/mcp/discover",
+        }
+
+    def test_routing_overrides_do_not_leak(self, oci_server):
+        """Test that request routing overrides don't mutate the shared defaults."""
+        spec = _create_mcpservice_spec_from_mcp_server(
+            oci_server, "ws-id", "ws-ns", routing={"mcpPath": "/custom"}
+        )
+        assert spec["spec"]["routing"]["mcpPath"] == "/custom"
+
+        spec = _create_mcpservice_spec_from_mcp_server(oci_server, "ws-id", "ws-ns")
+        assert spec["spec"]["routing"]["mcpPath"] == "/mcp"
+
+
 class TestSerializePackages:
     """Test _serialize_packages helper function."""
 
@@ -806,11 +890,8 @@ class TestDeployServerValidation:
         mock_request = Mock()
         mock_k8s_custom = MagicMock()
 
-        # Mock the 404 response to trigger create path
-        mock_k8s_custom.get_namespaced_custom_object.side_effect = ApiException(
-            status=404, reason="Not Found"
-        )
-        mock_k8s_custom.create_namespaced_custom_object.return_value = {}
+        mock_k8s_custom.get_namespaced_custom_object.side_effect = ApiException(status=404)
+        mock_k8s_custom.patch_namespaced_custom_object.return_value = {}
 
         with patch(
             "nimbletools_control_plane.routes.servers._get_cluster_architecture",
@@ -831,3 +912,80 @@ class TestDeployServerValidation:
                 assert result.server_id == "echo"
                 assert result.status == "pending"
                 assert "deployed successfully" in result.message
+
+                # A missing MCPService is created by the apply, with no replace
+                mock_k8s_custom.replace_namespaced_custom_object.assert_not_called()
+                apply_call = mock_k8s_custom.patch_namespaced_custom_object.call_args[1]
+                assert apply_call["name"] == "echo"
+                assert apply_call["namespace"] == "ws-test-workspace"
+                assert apply_call["_content_type"] == "application/apply-patch+yaml"
+                assert apply_call["field_manager"] == "nimbletools-control-plane"
+                assert apply_call["force"] is True
+
+    @pytest.mark.asyncio
+    async def test_deploy_migrates_legacy_mcpservice(self, valid_mcpb_server_data):
+        """A redeploy over a pre-apply MCPService replaces it once, then applies."""
+        mock_request = Mock()
+        mock_k8s_custom = MagicMock()
+
+        # Written by an older release: fields owned by an Update manager,
+        # including an environment variable the new deploy no longer sets
+        mock_k8s_custom.get_namespaced_custom_object.return_value = {
+            "metadata": {
+                "name": "echo",
+                "managedFields": [{"manager": "OpenAPI-Generator", "operation": "Update"}],
+            },
+            "spec": {"environment": {"STALE": "1"}},
+        }
+
+        with patch(
+            "nimbletools_control_plane.routes.servers._get_cluster_architecture",
+            return_value="amd64",
+        ):
+            with patch(
+                "nimbletools_control_plane.routes.servers.client.CustomObjectsApi",
+                return_value=mock_k8s_custom,
+            ):
+                await deploy_server_to_workspace(
+                    workspace_id="550e8400-e29b-41d4-a716-446655440000",
+                    server_request=valid_mcpb_server_data,
+                    request=mock_request,
+                    namespace_name="ws-test-workspace",
+                )
+
+        replace_body = mock_k8s_custom.replace_namespaced_custom_object.call_args[1]["body"]
+        assert replace_body["metadata"]["managedFields"] == [{}]
+        assert "STALE" not in replace_body["spec"].get("environment", {})
+
+        apply_body = mock_k8s_custom.patch_namespaced_custom_object.call_args[1]["body"]
+        assert "managedFields" not in apply_body["metadata"]
+
+    @pytest.mark.asyncio
+    async def test_deploy_skips_migration_once_applied(self, valid_mcpb_server_data):
+        """An MCPService already managed by apply is only re-applied."""
+        mock_request = Mock()
+        mock_k8s_custom = MagicMock()
+        mock_k8s_custom.get_namespaced_custom_object.return_value = {
+            "metadata": {
+                "name": "echo",
+                "managedFields": [{"manager": "nimbletools-control-plane", "operation": "Apply"}],
+            },
+        }
+
+        with patch(
+            "nimbletools_control_plane.routes.servers._get_cluster_architecture",
+            return_value="amd64",
+        ):
+            with patch(
+                "nimbletools_control_plane.routes.servers.client.CustomObjectsApi",
+                return_value=mock_k8s_custom,
+            ):
+                await deploy_server_to_workspace(
+                    workspace_id="550e8400-e29b-41d4-a716-446655440000",
+                    server_request=valid_mcpb_server_data,
+                    request=mock_request,
+                    namespace_name="ws-test-workspace",
+                )
+
+        mock_k8s_custom.replace_namespaced_custom_object.assert_not_called()
+        mock_k8s_custom.patch_namespaced_custom_object.assert_called_once()
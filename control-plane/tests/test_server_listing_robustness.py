@@ -7,7 +7,7 @@ import pytest
 from fastapi import HTTPException
 from kubernetes.client.rest import ApiException
 
-from nimbletools_control_plane.exceptions import KubernetesOperationError
+from nimbletools_control_plane.exceptions import ControlPlaneError, KubernetesOperationError
 from nimbletools_control_plane.routes.servers import list_workspace_servers
 
 
@@ -17,7 +17,7 @@ class TestServerListingRobustness:
     @pytest.fixture
     def mock_workspace_id(self):
         """Mock workspace ID."""
-        return "f33ae45a-f171-46da-b78e-2b4feca6dded"
+        return UUID("f33ae45a-f171-46da-b78e-2b4feca6dded")
 
     @pytest.fixture
     def mock_namespace_name(self):
@@ -70,11 +70,11 @@ class TestServerListingRobustness:
                 mock_mcpservices
             )
 
-            # Mock get_deployment_if_exists to return None (deployment doesn't exist yet)
+            # Mock list_deployments_by_name to return nothing (deployment doesn't exist yet)
             with patch(
-                "nimbletools_control_plane.routes.servers.get_deployment_if_exists"
-            ) as mock_get_deployment:
-                mock_get_deployment.return_value = None
+                "nimbletools_control_plane.routes.servers.list_deployments_by_name"
+            ) as mock_list_deployments:
+                mock_list_deployments.return_value = {}
 
                 # This should not crash and should return the server with status from MCPService
                 result = await list_workspace_servers(
@@ -89,7 +89,7 @@ class TestServerListingRobustness:
                 server = result.servers[0]
                 assert server.id == "echo-server"
                 assert server.status == "Pending"  # Should fall back to MCPService status
-                assert server.workspace_id == UUID(mock_workspace_id)
+                assert server.workspace_id == mock_workspace_id
 
     @pytest.mark.asyncio
     async def test_list_servers_with_deployment_no_ready_replicas(
@@ -116,13 +116,13 @@ class TestServerListingRobustness:
 
             with (
                 patch(
-                    "nimbletools_control_plane.routes.servers.get_deployment_if_exists"
-                ) as mock_get_deployment,
+                    "nimbletools_control_plane.routes.servers.list_deployments_by_name"
+                ) as mock_list_deployments,
                 patch(
                     "nimbletools_control_plane.routes.servers._check_pod_failure_status"
                 ) as mock_check_pod,
             ):
-                mock_get_deployment.return_value = mock_deployment
+                mock_list_deployments.return_value = {"echo-server-deployment": mock_deployment}
                 mock_check_pod.return_value = False  # No pod failures
 
                 result = await list_workspace_servers(
@@ -161,9 +161,9 @@ class TestServerListingRobustness:
             )
 
             with patch(
-                "nimbletools_control_plane.routes.servers.get_deployment_if_exists"
-            ) as mock_get_deployment:
-                mock_get_deployment.return_value = mock_deployment
+                "nimbletools_control_plane.routes.servers.list_deployments_by_name"
+            ) as mock_list_deployments:
+                mock_list_deployments.return_value = {"echo-server-deployment": mock_deployment}
 
                 result = await list_workspace_servers(
                     workspace_id=mock_workspace_id,
@@ -200,9 +200,9 @@ class TestServerListingRobustness:
             )
 
             with patch(
-                "nimbletools_control_plane.routes.servers.get_deployment_if_exists"
-            ) as mock_get_deployment:
-                mock_get_deployment.return_value = mock_deployment
+                "nimbletools_control_plane.routes.servers.list_deployments_by_name"
+            ) as mock_list_deployments:
+                mock_list_deployments.return_value = {"echo-server-deployment": mock_deployment}
 
                 result = await list_workspace_servers(
                     workspace_id=mock_workspace_id,
@@ -219,7 +219,7 @@ class TestServerListingRobustness:
     async def test_list_servers_with_get_deployment_exception(
         self, mock_workspace_id, mock_namespace_name, mock_request
     ):
-        """Test listing servers when get_deployment_if_exists throws an exception."""
+        """Test listing servers when list_deployments_by_name throws an exception."""
         mock_mcpservices = {
             "items": [
                 self.create_mock_mcpservice("echo-server", "Error"),
@@ -234,11 +234,13 @@ class TestServerListingRobustness:
             )
 
             with patch(
-                "nimbletools_control_plane.routes.servers.get_deployment_if_exists"
-            ) as mock_get_deployment:
-                # Simulate an unexpected error when trying to get deployment
-                mock_get_deployment.side_effect = Exception(
-                    "Kubernetes API temporarily unavailable"
+                "nimbletools_control_plane.routes.servers.list_deployments_by_name"
+            ) as mock_list_deployments:
+                # Simulate an unexpected error when listing deployments
+                mock_list_deployments.side_effect = ControlPlaneError(
+                    message="Failed to listing deployments 'unknown' due to unexpected error",
+                    operation="listing",
+                    resource="deployments:unknown",
                 )
 
                 # Should not crash the entire API call
@@ -257,7 +259,7 @@ class TestServerListingRobustness:
     async def test_list_servers_with_kubernetes_operation_error(
         self, mock_workspace_id, mock_namespace_name, mock_request
     ):
-        """Test listing servers when get_deployment_if_exists throws a KubernetesOperationError (transient K8s error)."""
+        """Test listing servers when list_deployments_by_name throws a KubernetesOperationError (transient K8s error)."""
         mock_mcpservices = {
             "items": [
                 self.create_mock_mcpservice("echo-server", "Pending"),
@@ -273,15 +275,15 @@ class TestServerListingRobustness:
             )
 
             with patch(
-                "nimbletools_control_plane.routes.servers.get_deployment_if_exists"
-            ) as mock_get_deployment:
+                "nimbletools_control_plane.routes.servers.list_deployments_by_name"
+            ) as mock_list_deployments:
                 # Simulate a transient Kubernetes error (e.g., timeout, connection issue)
                 # This is the specific bug we're fixing - transient errors during pod startup
                 api_exception = ApiException(status=503, reason="Service Temporarily Unavailable")
-                mock_get_deployment.side_effect = KubernetesOperationError(
-                    message="Failed to read deployment: Service Temporarily Unavailable",
-                    operation="reading",
-                    resource="deployment:echo-server-deployment",
+                mock_list_deployments.side_effect = KubernetesOperationError(
+                    message="Failed to list deployments: Service Temporarily Unavailable",
+                    operation="listing",
+                    resource="deployments:unknown",
                     api_exception=api_exception,
                 )
 
@@ -318,22 +320,23 @@ class TestServerListingRobustness:
             ]
         }
 
-        def mock_get_deployment_side_effect(deployment_name, namespace):
-            """Mock different deployment states for different servers."""
-            if "running-server" in deployment_name:
-                deployment = self.create_mock_deployment(ready_replicas=1, total_replicas=1)
-                deployment.status.unavailable_replicas = 0
-                deployment.status.conditions = None
-                return deployment
-            elif "pending-server" in deployment_name:
-                deployment = self.create_mock_deployment(ready_replicas=0, total_replicas=1)
-                deployment.status.unavailable_replicas = 1
-                deployment.status.conditions = None
-                return deployment
-            elif "error-server" in deployment_name:
-                # Simulate an error for this server
-                raise Exception("Deployment API error")
-            return None
+        running_deployment = self.create_mock_deployment(ready_replicas=1, total_replicas=1)
+        running_deployment.status.unavailable_replicas = 0
+        running_deployment.status.conditions = None
+
+        pending_deployment = self.create_mock_deployment(ready_replicas=0, total_replicas=1)
+        pending_deployment.status.unavailable_replicas = 1
+        pending_deployment.status.conditions = None
+
+        error_deployment = self.create_mock_deployment(ready_replicas=0, total_replicas=1)
+        error_deployment.status.unavailable_replicas = 1
+        error_deployment.status.conditions = None
+
+        def mock_check_pod_side_effect(namespace, server_name):
+            """Simulate an error while inspecting pods for one server."""
+            if server_name == "error-server":
+                raise Exception("Pod API error")
+            return False
 
         with patch(
             "nimbletools_control_plane.routes.servers.client.CustomObjectsApi"
@@ -344,14 +347,18 @@ class TestServerListingRobustness:
 
             with (
                 patch(
-                    "nimbletools_control_plane.routes.servers.get_deployment_if_exists"
-                ) as mock_get_deployment,
+                    "nimbletools_control_plane.routes.servers.list_deployments_by_name"
+                ) as mock_list_deployments,
                 patch(
                     "nimbletools_control_plane.routes.servers._check_pod_failure_status"
                 ) as mock_check_pod,
             ):
-                mock_get_deployment.side_effect = mock_get_deployment_side_effect
-                mock_check_pod.return_value = False  # No pod failures
+                mock_list_deployments.return_value = {
+                    "running-server-deployment": running_deployment,
+                    "pending-server-deployment": pending_deployment,
+                    "error-server-deployment": error_deployment,
+                }
+                mock_check_pod.side_effect = mock_check_pod_side_effect
 
                 result = await list_workspace_servers(
                     workspace_id=mock_workspace_id,
@@ -416,4 +423,34 @@ class TestServerListingRobustness:
             # Should return empty list without crashing
             assert result.total == 0
             assert len(result.servers) == 0
-            assert result.workspace_id == UUID(mock_workspace_id)
+            assert result.workspace_id == mock_workspace_id
+
+    @pytest.mark.asyncio
+    async def test_list_servers_skips_mcpservice_without_name(
+        self, mock_workspace_id, mock_namespace_name, mock_request
+    ):
+        """Test that an MCPService without a name is left out of the listing."""
+        nameless = self.create_mock_mcpservice("unused")
+        del nameless["metadata"]["name"]
+        mock_mcpservices = {"items": [nameless, self.create_mock_mcpservice("echo-server")]}
+
+        with patch(
+            "nimbletools_control_plane.routes.servers.client.CustomObjectsApi"
+        ) as mock_custom_api:
+            mock_custom_api.return_value.list_namespaced_custom_object.return_value = (
+                mock_mcpservices
+            )
+
+            with patch(
+                "nimbletools_control_plane.routes.servers.list_deployments_by_name"
+            ) as mock_list_deployments:
+                mock_list_deployments.return_value = {}
+
+                result = await list_workspace_servers(
+                    workspace_id=mock_workspace_id,
+                    request=mock_request,
+                    namespace_name=mock_namespace_name,
+                )
+
+                assert result.total == 1
+                assert [server.id for server in result.servers] == ["echo-server"]
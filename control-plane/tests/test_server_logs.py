@@ -56,6 +56,22 @@ class TestLogLineParsing:
         assert level == LogLevel.CRITICAL
         assert message == "System crash"
 
+    def test_parse_lowercase_level(self):
+        """Test that level names are matched case-insensitively."""
+        line = "2024-01-01T12:00:00Z [error] Request failed"
+        _timestamp, level, message = _parse_log_line(line)
+
+        assert level == LogLevel.ERROR
+        assert message == "Request failed"
+
+    def test_parse_unknown_level_defaults_to_info(self):
+        """Test that an unrecognised level word defaults to INFO."""
+        line = "2024-01-01T12:00:00Z [TRACE] Entering handler"
+        _timestamp, level, message = _parse_log_line(line)
+
+        assert level == LogLevel.INFO
+        assert message == "Entering handler"
+
     def test_parse_no_timestamp(self):
         """Test parsing line with no timestamp."""
         line = "[DEBUG] This is a debug message"
@@ -99,6 +115,14 @@ class TestLogLineParsing:
         assert timestamp.tzinfo is not None
         assert level == LogLevel.INFO
 
+    def test_parse_kubernetes_nanosecond_timestamp(self):
+        """Test that kubelet timestamps with nanosecond precision are parsed."""
+        line = "2025-09-29T05:46:08.722799261Z INFO:     Started server process"
+        timestamp, level, _message = _parse_log_line(line)
+
+        assert timestamp == datetime(2025, 9, 29, 5, 46, 8, 722799, tzinfo=UTC)
+        assert level == LogLevel.INFO
+
 
 class TestServerLogsEndpoint:
     """Test server logs endpoint functionality."""
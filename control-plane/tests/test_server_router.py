@@ -116,6 +116,7 @@ class TestServerStatusMapping:
 
         # Mock deployment with ready replicas
         mock_deployment = Mock()
+        mock_deployment.metadata.name = "echo-deployment"
         mock_deployment.status.ready_replicas = 1
         mock_deployment.status.replicas = 1
         mock_deployment.status.unavailable_replicas = 0
@@ -132,8 +133,10 @@ class TestServerStatusMapping:
                     "items": [mock_mcpservice]
                 }
 
-                # Mock deployment read
-                mock_apps_api.return_value.read_namespaced_deployment.return_value = mock_deployment
+                # Mock deployment list
+                mock_apps_api.return_value.list_namespaced_deployment.return_value = Mock(
+                    items=[mock_deployment]
+                )
 
                 # Create mock request
                 mock_request = Mock()
@@ -151,6 +154,12 @@ class TestServerStatusMapping:
                 assert server.image == "nimbletools/mcp-echo:latest"
                 assert server.replicas == 1
 
+                # All deployments come from a single list call, not one GET per server
+                mock_apps_api.return_value.list_namespaced_deployment.assert_called_once_with(
+                    namespace=namespace_name, label_selector="mcp.nimbletools.dev/service=true"
+                )
+                mock_apps_api.return_value.read_namespaced_deployment.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_server_status_shows_pending_when_deployment_has_replicas_but_none_ready(self):
         """Test server status shows 'Pending' when deployment exists but no ready replicas."""
@@ -168,6 +177,7 @@ class TestServerStatusMapping:
 
         # Mock deployment with replicas but none ready
         mock_deployment = Mock()
+        mock_deployment.metadata.name = "echo-deployment"
         mock_deployment.status.ready_replicas = 0
         mock_deployment.status.replicas = 1
         mock_deployment.status.unavailable_replicas = 1
@@ -186,7 +196,9 @@ class TestServerStatusMapping:
                 "items": [mock_mcpservice]
             }
 
-            mock_apps_api.return_value.read_namespaced_deployment.return_value = mock_deployment
+            mock_apps_api.return_value.list_namespaced_deployment.return_value = Mock(
+                items=[mock_deployment]
+            )
             mock_check_pod.return_value = False  # No pod failures
 
             mock_request = Mock()
@@ -223,9 +235,7 @@ class TestServerStatusMapping:
                 }
 
                 # Deployment not found
-                mock_apps_api.return_value.read_namespaced_deployment.side_effect = ApiException(
-                    status=404
-                )
+                mock_apps_api.return_value.list_namespaced_deployment.return_value = Mock(items=[])
 
                 mock_request = Mock()
 
@@ -263,9 +273,7 @@ class TestServerStatusMapping:
                 }
 
                 # Deployment not found
-                mock_apps_api.return_value.read_namespaced_deployment.side_effect = ApiException(
-                    status=404
-                )
+                mock_apps_api.return_value.list_namespaced_deployment.return_value = Mock(items=[])
 
                 mock_request = Mock()
 
@@ -623,8 +631,8 @@ class TestServerRestartRoute:
             ) as mock_custom_api:
                 with patch("nimbletools_control_plane.routes.servers.datetime") as mock_datetime:
                     # Mock a fixed datetime
-                    fixed_time = "2025-09-27T10:30:00.000000"
-                    mock_datetime.utcnow.return_value.isoformat.return_value = fixed_time
+                    fixed_time = "2025-09-27T10:30:00+00:00"
+                    mock_datetime.now.return_value.isoformat.return_value = fixed_time
 
                     mock_apps_api.return_value.read_namespaced_deployment.return_value = (
                         mock_deployment
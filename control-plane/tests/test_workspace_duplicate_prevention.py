@@ -161,7 +161,7 @@ class TestWorkspaceDuplicatePrevention:
 
     @pytest.mark.asyncio
     async def test_create_workspace_checks_correct_label_selector(self):
-        """Test that duplicate check uses correct label selector for organization."""
+        """Test that duplicate check selects on the organization-scoped unique key."""
         mock_user = {
             "user_id": "550e8400-e29b-41d4-a716-446655440000",
             "organization_id": "123e4567-e89b-12d3-a456-426614174000",
@@ -192,7 +192,8 @@ class TestWorkspaceDuplicatePrevention:
 
                 await create_workspace(workspace_request, mock_user)
 
-                # Verify correct label selector was used to check for duplicates
+                # Verify the duplicate check matches the org-scoped unique key server-side
                 mock_k8s_instance.list_namespace.assert_called_with(
-                    label_selector="mcp.nimbletools.dev/workspace=true,mcp.nimbletools.dev/organization_id=123e4567-e89b-12d3-a456-426614174000"
+                    label_selector="mcp.nimbletools.dev/workspace=true,mcp.nimbletools.dev/unique_key=test-workspace-123e4567-e89b-12d3-a456-426614174000",
+                    limit=1,
                 )
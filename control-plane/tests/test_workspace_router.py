@@ -8,8 +8,9 @@ from fastapi.testclient import TestClient
 from kubernetes.client.rest import ApiException
 
 from nimbletools_control_plane.auth import get_workspace_namespace
-from nimbletools_control_plane.models import WorkspaceListResponse
-from nimbletools_control_plane.routes.workspaces import list_workspaces
+from nimbletools_control_plane.models import WorkspaceDetailsResponse, WorkspaceListResponse
+from nimbletools_control_plane.routes import workspaces
+from nimbletools_control_plane.routes.workspaces import get_workspace_details, list_workspaces
 
 
 @pytest.fixture
@@ -149,6 +150,7 @@ class TestWorkspaceListingRegression:
             # Mock namespace list response
             mock_namespaces = Mock()
             mock_namespaces.items = multiple_workspace_namespaces
+            mock_namespaces.metadata._continue = None
             mock_k8s_core.list_namespace.return_value = mock_namespaces
 
             response = client.get("/v1/workspaces")
@@ -162,7 +164,8 @@ class TestWorkspaceListingRegression:
 
             # CRITICAL: Verify the correct label selector was used (including organization filter)
             mock_k8s_core.list_namespace.assert_called_once_with(
-                label_selector="mcp.nimbletools.dev/workspace=true,mcp.nimbletools.dev/organization_id=123e4567-e89b-12d3-a456-426614174000"
+                label_selector="mcp.nimbletools.dev/workspace=true,mcp.nimbletools.dev/organization_id=123e4567-e89b-12d3-a456-426614174000",
+                limit=500,
             )
 
             # Verify workspace details are correct
@@ -185,6 +188,7 @@ class TestWorkspaceListingRegression:
             # Simulate what happens with wrong label selector - no results
             mock_namespaces = Mock()
             mock_namespaces.items = []  # Empty because wrong label
+            mock_namespaces.metadata._continue = None
             mock_k8s_core.list_namespace.return_value = mock_namespaces
 
             response = client.get("/v1/workspaces")
@@ -211,6 +215,7 @@ class TestWorkspaceListingRegression:
 
             mock_namespaces = Mock()
             mock_namespaces.items = multiple_workspace_namespaces
+            mock_namespaces.metadata._continue = None
             mock_k8s_core.list_namespace.return_value = mock_namespaces
 
             response = client.get("/v1/workspaces")
@@ -219,7 +224,8 @@ class TestWorkspaceListingRegression:
 
             # CRITICAL: Should use basic workspace selector, not owner filtering
             mock_k8s_core.list_namespace.assert_called_once_with(
-                label_selector="mcp.nimbletools.dev/workspace=true,mcp.nimbletools.dev/organization_id=123e4567-e89b-12d3-a456-426614174000"
+                label_selector="mcp.nimbletools.dev/workspace=true,mcp.nimbletools.dev/organization_id=123e4567-e89b-12d3-a456-426614174000",
+                limit=500,
             )
 
     @pytest.mark.skip(reason="Enterprise mode mocking needs fixes after model refactoring")
@@ -256,6 +262,7 @@ class TestWorkspaceListingRegression:
 
                     mock_namespaces = Mock()
                     mock_namespaces.items = []  # No workspaces for this user
+                    mock_namespaces.metadata._continue = None
                     mock_k8s_core.list_namespace.return_value = mock_namespaces
 
                 response = client.get("/v1/workspaces")
@@ -264,7 +271,8 @@ class TestWorkspaceListingRegression:
 
                 # CRITICAL: Should use owner filtering in enterprise mode
                 mock_k8s_core.list_namespace.assert_called_once_with(
-                    label_selector="mcp.nimbletools.dev/workspace=true,mcp.nimbletools.dev/owner=enterprise-user"
+                    label_selector="mcp.nimbletools.dev/workspace=true,mcp.nimbletools.dev/owner=enterprise-user",
+                    limit=500,
                 )
 
     def test_workspace_list_parses_labels_correctly(
@@ -281,6 +289,7 @@ class TestWorkspaceListingRegression:
 
             mock_namespaces = Mock()
             mock_namespaces.items = [sample_workspace_namespace]
+            mock_namespaces.metadata._continue = None
             mock_k8s_core.list_namespace.return_value = mock_namespaces
 
             response = client.get("/v1/workspaces")
@@ -319,6 +328,7 @@ class TestWorkspaceListingRegression:
 
             mock_namespaces = Mock()
             mock_namespaces.items = [minimal_namespace]
+            mock_namespaces.metadata._continue = None
             mock_k8s_core.list_namespace.return_value = mock_namespaces
 
             response = client.get("/v1/workspaces")
@@ -369,6 +379,7 @@ class TestWorkspaceListingRegression:
 
                 mock_namespaces = Mock()
                 mock_namespaces.items = [mock_ns]
+                mock_namespaces.metadata._continue = None
                 mock_k8s_core.list_namespace.return_value = mock_namespaces
 
             response = client.get("/v1/workspaces")
@@ -389,6 +400,7 @@ class TestWorkspaceListingRegression:
             # No workspaces found
             mock_namespaces = Mock()
             mock_namespaces.items = []
+            mock_namespaces.metadata._continue = None
             mock_k8s_core.list_namespace.return_value = mock_namespaces
 
             response = client.get("/v1/workspaces")
@@ -401,7 +413,8 @@ class TestWorkspaceListingRegression:
 
             # Should still use correct label selector
             mock_k8s_core.list_namespace.assert_called_once_with(
-                label_selector="mcp.nimbletools.dev/workspace=true,mcp.nimbletools.dev/organization_id=123e4567-e89b-12d3-a456-426614174000"
+                label_selector="mcp.nimbletools.dev/workspace=true,mcp.nimbletools.dev/organization_id=123e4567-e89b-12d3-a456-426614174000",
+                limit=500,
             )
 
 
@@ -427,6 +440,7 @@ class TestWorkspaceLabelSelectorRegression:
 
             mock_namespaces = Mock()
             mock_namespaces.items = multiple_workspace_namespaces
+            mock_namespaces.metadata._continue = None
             mock_k8s_core.list_namespace.return_value = mock_namespaces
 
             response = client.get("/v1/workspaces")
@@ -489,6 +503,7 @@ class TestWorkspaceLabelSelectorRegression:
 
                     mock_namespaces = Mock()
                     mock_namespaces.items = []
+                    mock_namespaces.metadata._continue = None
                     mock_k8s_core.list_namespace.return_value = mock_namespaces
 
                 response = client.get("/v1/workspaces")
@@ -518,6 +533,7 @@ class TestWorkspaceLabelSelectorRegression:
 
             mock_namespaces = Mock()
             mock_namespaces.items = [sample_workspace_namespace]
+            mock_namespaces.metadata._continue = None
             mock_k8s_core.list_namespace.return_value = mock_namespaces
 
             response = client.get("/v1/workspaces")
@@ -722,7 +738,7 @@ class TestWorkspaceSecretManagement:
             mock_k8s_core_class.return_value = mock_k8s_core
 
             # Mock that secret doesn't exist (404)
-            mock_k8s_core.read_namespaced_secret.side_effect = ApiException(status=404)
+            mock_k8s_core.patch_namespaced_secret.side_effect = ApiException(status=404)
 
             # Mock namespace list for the middleware validator
             mock_namespace = Mock()
@@ -759,11 +775,6 @@ class TestWorkspaceSecretManagement:
             mock_k8s_core = Mock()
             mock_k8s_core_class.return_value = mock_k8s_core
 
-            # Mock existing secret
-            mock_existing_secret = Mock()
-            mock_existing_secret.data = {"OTHER_KEY": "other_value"}
-            mock_k8s_core.read_namespaced_secret.return_value = mock_existing_secret
-
             # Mock namespace list for the middleware validator
             mock_namespace = Mock()
             mock_namespace.metadata.name = "ws-test-550e8400-e29b-41d4-a716-446655440001"
@@ -788,8 +799,106 @@ class TestWorkspaceSecretManagement:
             assert data["status"] == "success"
             assert "set successfully" in data["message"]
 
-            # Verify patch_namespaced_secret was called
-            mock_k8s_core.patch_namespaced_secret.assert_called_once()
+            # Only the updated key is sent, without reading the secret first
+            mock_k8s_core.read_namespaced_secret.assert_not_called()
+            mock_k8s_core.patch_namespaced_secret.assert_called_once_with(
+                name="workspace-secrets",
+                namespace="ws-test-550e8400-e29b-41d4-a716-446655440001",
+                body={"data": {"API_KEY": "dXBkYXRlZC1zZWNyZXQtdmFsdWU="}},
+            )
+
+    def test_set_workspace_secrets_batch_patches_once(
+        self, client: TestClient, mock_k8s_config, mock_auth_provider
+    ):
+        """Test that setting several secrets sends one patch with every key."""
+        with patch("kubernetes.client.CoreV1Api") as mock_k8s_core_class:
+            mock_k8s_core = Mock()
+            mock_k8s_core_class.return_value = mock_k8s_core
+
+            # Mock namespace list for the middleware validator
+            mock_namespace = Mock()
+            mock_namespace.metadata.name = "ws-test-550e8400-e29b-41d4-a716-446655440001"
+            mock_namespace.metadata.labels = {
+                "mcp.nimbletools.dev/workspace_id": "550e8400-e29b-41d4-a716-446655440001",
+                "mcp.nimbletools.dev/workspace_name": "test-550e8400-e29b-41d4-a716-446655440001",
+            }
+            mock_namespaces = Mock()
+            mock_namespaces.items = [mock_namespace]
+            mock_k8s_core.list_namespace.return_value = mock_namespaces
+
+            response = client.put(
+                "/v1/workspaces/550e8400-e29b-41d4-a716-446655440001/secrets",
+                json={"secrets": {"DB_PASSWORD": "secret", "API_KEY": "test-value"}},
+            )
+
+            assert response.status_code == 200
+            data = response.json()
+            assert data["secrets"] == ["API_KEY", "DB_PASSWORD"]
+            assert data["count"] == 2
+
+            mock_k8s_core.read_namespaced_secret.assert_not_called()
+            mock_k8s_core.create_namespaced_secret.assert_not_called()
+            mock_k8s_core.patch_namespaced_secret.assert_called_once_with(
+                name="workspace-secrets",
+                namespace="ws-test-550e8400-e29b-41d4-a716-446655440001",
+                body={"data": {"DB_PASSWORD": "c2VjcmV0", "API_KEY": "dGVzdC12YWx1ZQ=="}},
+            )
+
+    def test_set_workspace_secrets_batch_creates_missing_secret(
+        self, client: TestClient, mock_k8s_config, mock_auth_provider
+    ):
+        """Test that the batch endpoint creates the secret when it doesn't exist."""
+        with patch("kubernetes.client.CoreV1Api") as mock_k8s_core_class:
+            mock_k8s_core = Mock()
+            mock_k8s_core_class.return_value = mock_k8s_core
+            mock_k8s_core.patch_namespaced_secret.side_effect = ApiException(status=404)
+
+            # Mock namespace list for the middleware validator
+            mock_namespace = Mock()
+            mock_namespace.metadata.name = "ws-test-550e8400-e29b-41d4-a716-446655440001"
+            mock_namespace.metadata.labels = {
+                "mcp.nimbletools.dev/workspace_id": "550e8400-e29b-41d4-a716-446655440001",
+                "mcp.nimbletools.dev/workspace_name": "test-550e8400-e29b-41d4-a716-446655440001",
+            }
+            mock_namespaces = Mock()
+            mock_namespaces.items = [mock_namespace]
+            mock_k8s_core.list_namespace.return_value = mock_namespaces
+
+            response = client.put(
+                "/v1/workspaces/550e8400-e29b-41d4-a716-446655440001/secrets",
+                json={"secrets": {"API_KEY": "test-value", "DB_PASSWORD": "secret"}},
+            )
+
+            assert response.status_code == 200
+            created = mock_k8s_core.create_namespaced_secret.call_args[1]["body"]
+            assert created.data == {"API_KEY": "dGVzdC12YWx1ZQ==", "DB_PASSWORD": "c2VjcmV0"}
+
+    def test_set_workspace_secrets_batch_rejects_empty(
+        self, client: TestClient, mock_k8s_config, mock_auth_provider
+    ):
+        """Test that an empty batch is rejected before touching Kubernetes."""
+        with patch("kubernetes.client.CoreV1Api") as mock_k8s_core_class:
+            mock_k8s_core = Mock()
+            mock_k8s_core_class.return_value = mock_k8s_core
+
+            # Mock namespace list for the middleware validator
+            mock_namespace = Mock()
+            mock_namespace.metadata.name = "ws-test-550e8400-e29b-41d4-a716-446655440001"
+            mock_namespace.metadata.labels = {
+                "mcp.nimbletools.dev/workspace_id": "550e8400-e29b-41d4-a716-446655440001",
+                "mcp.nimbletools.dev/workspace_name": "test-550e8400-e29b-41d4-a716-446655440001",
+            }
+            mock_namespaces = Mock()
+            mock_namespaces.items = [mock_namespace]
+            mock_k8s_core.list_namespace.return_value = mock_namespaces
+
+            response = client.put(
+                "/v1/workspaces/550e8400-e29b-41d4-a716-446655440001/secrets",
+                json={"secrets": {}},
+            )
+
+            assert response.status_code == 422
+            mock_k8s_core.patch_namespaced_secret.assert_not_called()
 
     def test_delete_workspace_secret_success(
         self, client: TestClient, mock_k8s_config, mock_auth_provider
@@ -973,6 +1082,7 @@ class TestCommunityProviderAuthentication:
 
             mock_namespaces = Mock()
             mock_namespaces.items = [ws1, ws2]
+            mock_namespaces.metadata._continue = None
             mock_k8s_core.list_namespace.return_value = mock_namespaces
 
             # Call the list_workspaces function directly with mock user
@@ -1006,5 +1116,97 @@ class TestCommunityProviderAuthentication:
 
             # Verify the correct label selector was used
             mock_k8s_core.list_namespace.assert_called_once_with(
-                label_selector="mcp.nimbletools.dev/workspace=true,mcp.nimbletools.dev/organization_id=00000000-0000-0000-0000-000000000002"
+                label_selector="mcp.nimbletools.dev/workspace=true,mcp.nimbletools.dev/organization_id=00000000-0000-0000-0000-000000000002",
+                limit=500,
             )
+
+
+class TestWorkspaceDetails:
+    """Test workspace details are built from the resolved namespace."""
+
+    @pytest.mark.asyncio
+    async def test_get_workspace_details_uses_resolved_namespace(self, sample_workspace_namespace):
+        """Details come from the dependency's namespace without a second read."""
+        with patch("kubernetes.client.CoreV1Api") as mock_k8s_core_class:
+            result = await get_workspace_details(
+                "123e4567-e89b-12d3-a456-426614174000", Mock(), sample_workspace_namespace
+            )
+
+            mock_k8s_core_class.assert_not_called()
+
+        assert isinstance(result, WorkspaceDetailsResponse)
+        assert str(result.workspace_id) == "123e4567-e89b-12d3-a456-426614174000"
+        assert result.namespace == "ws-test-workspace-123e4567-e89b-12d3-a456-426614174000"
+        assert str(result.user_id) == "550e8400-e29b-41d4-a716-446655440000"
+        assert result.created_at is not None
+
+
+class TestWorkspaceListCache:
+    """Test that workspace listings are briefly cached."""
+
+    def test_repeated_listing_reuses_cached_namespaces(
+        self,
+        client: TestClient,
+        mock_k8s_config,
+        mock_auth_provider,
+        multiple_workspace_namespaces,
+    ):
+        """A second listing within the TTL doesn't hit the API server."""
+        with patch("kubernetes.client.CoreV1Api") as mock_k8s_core_class:
+            mock_k8s_core = Mock()
+            mock_k8s_core_class.return_value = mock_k8s_core
+            mock_k8s_core.list_namespace.return_value.items = multiple_workspace_namespaces
+            mock_k8s_core.list_namespace.return_value.metadata._continue = None
+
+            first = client.get("/v1/workspaces")
+            second = client.get("/v1/workspaces")
+
+            assert first.json() == second.json()
+            assert mock_k8s_core.list_namespace.call_count == 1
+
+    def test_listing_after_ttl_relists(
+        self,
+        client: TestClient,
+        mock_k8s_config,
+        mock_auth_provider,
+        multiple_workspace_namespaces,
+    ):
+        """An expired cache entry triggers a fresh list."""
+        label_selector = (
+            "mcp.nimbletools.dev/workspace=true,"
+            "mcp.nimbletools.dev/organization_id=123e4567-e89b-12d3-a456-426614174000"
+        )
+        workspaces._workspace_list_cache[label_selector] = (0.0, [])
+
+        with patch("kubernetes.client.CoreV1Api") as mock_k8s_core_class:
+            mock_k8s_core = Mock()
+            mock_k8s_core_class.return_value = mock_k8s_core
+            mock_k8s_core.list_namespace.return_value.items = multiple_workspace_namespaces
+            mock_k8s_core.list_namespace.return_value.metadata._continue = None
+
+            response = client.get("/v1/workspaces")
+
+            assert response.json()["total"] == 3
+            mock_k8s_core.list_namespace.assert_called_once()
+
+    def test_create_workspace_invalidates_cached_listing(
+        self,
+        client: TestClient,
+        mock_k8s_config,
+        mock_auth_provider,
+        multiple_workspace_namespaces,
+    ):
+        """Creating a workspace drops cached listings so it shows up immediately."""
+        with patch("kubernetes.client.CoreV1Api") as mock_k8s_core_class:
+            mock_k8s_core = Mock()
+            mock_k8s_core_class.return_value = mock_k8s_core
+            mock_k8s_core.list_namespace.return_value.items = multiple_workspace_namespaces
+            mock_k8s_core.list_namespace.return_value.metadata._continue = None
+
+            client.get("/v1/workspaces")
+            assert workspaces._workspace_list_cache
+
+            response = client.post("/v1/workspaces", json={"name": "new-workspace"})
+
+            assert response.status_code == 200
+            assert not workspaces._workspace_list_cache
@@ -59,6 +59,9 @@ except config.ConfigException:
     config.load_kube_config()
     logger.info("Loaded local Kubernetes config")
 
+# Prefer libyaml's C emitter when PyYAML was built with it
+_YamlDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 # Initialize Kubernetes clients
 k8s_apps = client.AppsV1Api()
 k8s_core = client.CoreV1Api()
@@ -306,7 +309,14 @@ class CoreMCPOperator:
                     "mcp.nimbletools.dev/managed-by": "nimbletools-core-operator",
                 },
             ),
-            data={"config.yaml": yaml.dump(config_data, default_flow_style=False)},
+            data={
+                "config.yaml": yaml.dump(
+                    config_data,
+                    Dumper=_YamlDumper,
+                    default_flow_style=False,
+                    sort_keys=False,
+                )
+            },
         )
 
     def create_deployment(